@@ -6,6 +6,8 @@ from __future__ import annotations
 class DNSResolver:
     """Stub for aiodns.DNSResolver."""
 
+    __slots__ = ()
+
     def __init__(self, *_args: object, **_kwargs: object) -> None:
         pass
 
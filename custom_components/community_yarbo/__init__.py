@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections.abc import Coroutine, Mapping
 from typing import Any
 
 import homeassistant.helpers.config_validation as cv
-from homeassistant.config_entries import SOURCE_DHCP, ConfigEntry
-from homeassistant.const import __version__
+from homeassistant.config_entries import SOURCE_DHCP, ConfigEntry, ConfigEntryState
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, __version__
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryError, ConfigEntryNotReady
+from homeassistant.helpers.event import async_call_later
 from homeassistant.loader import async_get_integration
 from yarbo import YarboLocalClient
 from yarbo.exceptions import YarboConnectionError
@@ -33,19 +36,24 @@ from .const import (  # noqa: E402
     CONF_BROKER_HOST,
     CONF_BROKER_PORT,
     CONF_ROBOT_SERIAL,
-    DATA_CLIENT,
-    DATA_COORDINATOR,
     DEFAULT_BROKER_PORT,
     DEFAULT_ERROR_REPORTING,
     DOMAIN,
     OPT_ERROR_REPORTING,
     PLATFORMS,
+    coerce_broker_port,
 )
 
 CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
 
-from .coordinator import YarboDataCoordinator  # noqa: E402
+from .coordinator import YarboDataCoordinator, YarboRuntimeData  # noqa: E402
+from .discovery import _discover_from_arp  # noqa: E402
 from .error_reporting import async_init_error_reporting  # noqa: E402
+from .repairs import (  # noqa: E402
+    async_delete_cloud_token_expired_issue,
+    async_delete_controller_lost_issue,
+    async_delete_mqtt_disconnect_issue,
+)
 from .services import async_register_services, async_unregister_services  # noqa: E402
 
 _LOGGER = logging.getLogger(__name__)
@@ -56,23 +64,22 @@ async def async_setup(hass: HomeAssistant, config: dict[str, Any]) -> bool:
 
     async def _discover_yarbos(_now: Any = None) -> None:
         """Scan ARP table for Yarbo devices and create discovery flows."""
-        from .discovery import DEFAULT_BROKER_PORT, _discover_from_arp
-
         endpoints = await _discover_from_arp(DEFAULT_BROKER_PORT)
         if not endpoints:
             return
 
-        for ep in endpoints:
-            # Check if already configured for this host
-            existing = any(
-                entry.data.get(CONF_BROKER_HOST) == ep.host
-                for entry in hass.config_entries.async_entries(DOMAIN)
-            )
-            if existing:
-                continue
+        # Hosts that already have an entry; built once per pass
+        configured = {
+            entry.data.get(CONF_BROKER_HOST) for entry in hass.config_entries.async_entries(DOMAIN)
+        }
+        new_endpoints = [ep for ep in endpoints if ep.host not in configured]
+        if not new_endpoints:
+            return
 
+        flows: list[Coroutine[Any, Any, Any]] = []
+        for ep in new_endpoints:
             _LOGGER.info("Yarbo discovered via ARP at %s (MAC %s)", ep.host, ep.mac)
-            hass.async_create_task(
+            flows.append(
                 hass.config_entries.flow.async_init(
                     DOMAIN,
                     context={"source": SOURCE_DHCP},
@@ -80,10 +87,18 @@ async def async_setup(hass: HomeAssistant, config: dict[str, Any]) -> bool:
                 )
             )
 
-    # Run 30s after HA fully starts so the network stack is ready
-    from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
-    from homeassistant.helpers.event import async_call_later
+        async def _start_flows() -> None:
+            for result in await asyncio.gather(*flows, return_exceptions=True):
+                if isinstance(result, BaseException):
+                    _LOGGER.warning(
+                        "Yarbo ARP discovery flow failed to start: %s", result, exc_info=result
+                    )
+
+        # One tracked task for the whole batch; HA cancels it on shutdown.
+        # Start eagerly so the flows are created in this loop iteration.
+        hass.async_create_task(_start_flows(), eager_start=True)
 
+    # Run 30s after HA fully starts so the network stack is ready
     async def _on_start(_event: Any) -> None:
         async_call_later(hass, 30, _discover_yarbos)
 
@@ -97,12 +112,16 @@ async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
 
     if config_entry.version == 1:
         # v1 → v2: add CONF_BROKER_ENDPOINTS list for Primary/Secondary failover
+        if CONF_BROKER_ENDPOINTS in config_entry.data and config_entry.data.get(CONF_BROKER_HOST):
+            # Already carries the v2 fields; only the version needs bumping
+            hass.config_entries.async_update_entry(config_entry, version=2)
+            _LOGGER.info("Migrated Yarbo config entry to version 2")
+            return True
         new_data = dict(config_entry.data)
         primary = new_data.get(CONF_BROKER_HOST)
         alternate = new_data.get(CONF_ALTERNATE_BROKER_HOST)
         if CONF_BROKER_ENDPOINTS not in new_data:
-            endpoints = [primary, alternate] if alternate and alternate != primary else [primary]
-            new_data[CONF_BROKER_ENDPOINTS] = [h for h in endpoints if h]
+            new_data[CONF_BROKER_ENDPOINTS] = _normalize_endpoints(primary, alternate)
         # Rare corrupt v1 rows: broker_host missing but endpoints or alternate present
         if not new_data.get(CONF_BROKER_HOST):
             backfill = next((h for h in new_data.get(CONF_BROKER_ENDPOINTS, []) if h), None)
@@ -156,7 +175,18 @@ def _warmup_connect(host: str, port: int) -> None:
         pass  # Warmup failure is non-fatal
 
 
-def _resolve_broker_host(data: dict[str, Any]) -> str | None:
+def _normalize_endpoints(primary: Any, alternate: Any) -> list[Any]:
+    """Return the Primary/Secondary endpoint list derived from legacy host fields."""
+    raw = [primary, alternate] if alternate and alternate != primary else [primary]
+    return [h for h in raw if h]
+
+
+def _mask_serial(serial: str) -> str:
+    """Return the serial with all but the last 4 characters masked."""
+    return f"****{serial[-4:]}" if len(serial) > 4 else serial
+
+
+def _resolve_broker_host(data: Mapping[str, Any]) -> str | None:
     """Return MQTT broker host from entry data (explicit key or endpoint list)."""
     host = data.get(CONF_BROKER_HOST)
     if host:
@@ -206,30 +236,23 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             )
     # --- End version guard ---
     # Normalize broker_host + CONF_BROKER_ENDPOINTS (handles corrupt / legacy storage)
-    data = dict(entry.data)
-    changed = False
-    if CONF_BROKER_ENDPOINTS not in data:
-        primary = data.get(CONF_BROKER_HOST)
-        alternate = data.get(CONF_ALTERNATE_BROKER_HOST)
-        raw: list[Any] = [primary, alternate] if alternate and alternate != primary else [primary]
-        data[CONF_BROKER_ENDPOINTS] = [h for h in raw if h]
-        changed = True
-    resolved_host = _resolve_broker_host(data)
-    if resolved_host and not data.get(CONF_BROKER_HOST):
-        data[CONF_BROKER_HOST] = resolved_host
-        changed = True
-    if not data.get(CONF_BROKER_ENDPOINTS) and resolved_host:
-        data[CONF_BROKER_ENDPOINTS] = [resolved_host]
-        changed = True
-    if changed:
-        hass.config_entries.async_update_entry(entry, data=data)
+    # Only copy and rewrite entry.data when something actually needs fixing.
+    updates: dict[str, Any] = {}
+    endpoints = entry.data.get(CONF_BROKER_ENDPOINTS)
+    if CONF_BROKER_ENDPOINTS not in entry.data:
+        endpoints = updates[CONF_BROKER_ENDPOINTS] = _normalize_endpoints(
+            entry.data.get(CONF_BROKER_HOST), entry.data.get(CONF_ALTERNATE_BROKER_HOST)
+        )
+    resolved_host = _resolve_broker_host(entry.data)
+    if resolved_host and not entry.data.get(CONF_BROKER_HOST):
+        updates[CONF_BROKER_HOST] = resolved_host
+    if not endpoints and resolved_host:
+        updates[CONF_BROKER_ENDPOINTS] = [resolved_host]
+    if updates:
+        hass.config_entries.async_update_entry(entry, data={**entry.data, **updates})
 
     broker_host = _resolve_broker_host(entry.data)
-    broker_port = entry.data.get(CONF_BROKER_PORT, DEFAULT_BROKER_PORT)
-    if broker_port in (None, ""):
-        broker_port = DEFAULT_BROKER_PORT
-    else:
-        broker_port = int(broker_port)
+    broker_port = coerce_broker_port(entry.data.get(CONF_BROKER_PORT))
     if not broker_host:
         _LOGGER.error(
             "Yarbo config entry %s is missing broker_host and no usable endpoints",
@@ -240,28 +263,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             "Remove the integration and set it up again, or use Reconfigure."
         )
 
-    # Get actual integration version from manifest
-    integration_version = "unknown"
-    try:
-        integration = await async_get_integration(hass, DOMAIN)
-        integration_version = integration.manifest.get("version", "unknown") or "unknown"
-    except Exception as err:
-        _LOGGER.debug("Could not fetch integration version: %s", err)
-
-    # Opt-in error reporting: read option, default enabled during beta
-    _serial = entry.data.get(CONF_ROBOT_SERIAL, "unknown")
-    error_reporting_enabled = entry.options.get(OPT_ERROR_REPORTING, DEFAULT_ERROR_REPORTING)
-    await async_init_error_reporting(
-        hass,
-        enabled=error_reporting_enabled,
-        tags={
-            "integration": DOMAIN,
-            "integration_version": integration_version,
-            "robot_serial": f"****{_serial[-4:]}" if len(_serial) > 4 else _serial,
-            "ha_version": __version__,
-        },
-    )
-
     # Pre-fill import caches (idna metadata etc.) in executor to avoid
     # blocking-call warnings during the real connect.
     try:
@@ -279,15 +280,41 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         sn=entry.data.get(CONF_ROBOT_SERIAL, ""),
     )
 
-    try:
-        # connect() internally uses run_in_executor for blocking I/O (DNS/TLS).
-        await client.connect()
-    except YarboConnectionError as err:
-        await client.disconnect()
-        raise ConfigEntryNotReady(f"Cannot connect to Yarbo: {err}") from err
-    except Exception:
+    # Load the manifest while the MQTT handshake is in flight instead of
+    # paying for both round-trips back to back.
+    # connect() internally uses run_in_executor for blocking I/O (DNS/TLS).
+    integration_result, connect_result = await asyncio.gather(
+        async_get_integration(hass, DOMAIN),
+        client.connect(),
+        return_exceptions=True,
+    )
+
+    # Get actual integration version from manifest
+    integration_version = "unknown"
+    if isinstance(integration_result, BaseException):
+        _LOGGER.debug("Could not fetch integration version: %s", integration_result)
+    else:
+        integration_version = integration_result.manifest.get("version", "unknown") or "unknown"
+
+    # Opt-in error reporting: read option, default enabled during beta
+    if entry.options.get(OPT_ERROR_REPORTING, DEFAULT_ERROR_REPORTING):
+        _serial = entry.data.get(CONF_ROBOT_SERIAL, "unknown")
+        await async_init_error_reporting(
+            hass,
+            tags={
+                "integration": DOMAIN,
+                "integration_version": integration_version,
+                "robot_serial": _mask_serial(_serial),
+                "ha_version": __version__,
+            },
+        )
+
+    if isinstance(connect_result, BaseException):
         await client.disconnect()
-        raise
+        if isinstance(connect_result, YarboConnectionError):
+            err = connect_result
+            raise ConfigEntryNotReady(f"Cannot connect to Yarbo: {err}") from err
+        raise connect_result
 
     coordinator = YarboDataCoordinator(hass, client, entry)
     try:
@@ -298,10 +325,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         await client.disconnect()
         raise
 
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
-        DATA_CLIENT: client,
-        DATA_COORDINATOR: coordinator,
-    }
+    entry.runtime_data = YarboRuntimeData(client=client, coordinator=coordinator)
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     async_register_services(hass)
@@ -316,28 +340,18 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def _async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle options update — propagate new options to the coordinator."""
-    # Avoid KeyError when runtime data was never stored or was already torn down
-    # (e.g. reload race, failed setup, GlitchTip #148 / GitHub #148).
-    domain_data = hass.data.get(DOMAIN)
-    if not isinstance(domain_data, dict):
-        return
-    entry_data = domain_data.get(entry.entry_id)
-    if not isinstance(entry_data, dict):
+    # Avoid AttributeError when runtime data was never stored or was already torn
+    # down (e.g. reload race, failed setup, GlitchTip #148 / GitHub #148).
+    runtime_data = getattr(entry, "runtime_data", None)
+    if not isinstance(runtime_data, YarboRuntimeData):
         _LOGGER.warning(
             "Options update for entry %s skipped — integration not fully loaded",
             entry.entry_id,
         )
         return
-    coordinator = entry_data.get(DATA_COORDINATOR)
-    if coordinator is None:
-        _LOGGER.warning(
-            "Options update for entry %s skipped — no coordinator (setup incomplete or unloaded)",
-            entry.entry_id,
-        )
-        return
     try:
         options: dict[str, Any] = dict(entry.options)
-        coordinator.update_options(options)
+        runtime_data.coordinator.update_options(options)
     except KeyError as err:
         _LOGGER.warning(
             "Options update for entry %s failed (%s) — ignoring",
@@ -350,24 +364,19 @@ async def _async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    from .repairs import (
-        async_delete_cloud_token_expired_issue,
-        async_delete_controller_lost_issue,
-        async_delete_mqtt_disconnect_issue,
-    )
-
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
-        domain_data = hass.data.get(DOMAIN)
-        data = domain_data.pop(entry.entry_id, None) if domain_data else None
-        if data is not None:
-            coordinator = data.get(DATA_COORDINATOR)
-            client = data.get(DATA_CLIENT)
-            if coordinator is not None:
-                await coordinator.async_shutdown()
-            if client is not None:
-                await client.disconnect()
+        runtime_data = getattr(entry, "runtime_data", None)
+        if isinstance(runtime_data, YarboRuntimeData):
+            try:
+                await runtime_data.coordinator.async_shutdown()
+            except Exception as err:
+                _LOGGER.warning("Yarbo unload: coordinator shutdown failed: %s", err)
+            try:
+                await runtime_data.client.disconnect()
+            except Exception as err:
+                _LOGGER.warning("Yarbo unload: MQTT disconnect failed: %s", err)
         else:
             _LOGGER.warning(
                 "Yarbo unload: no runtime data for entry %s (already removed?)",
@@ -377,8 +386,12 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         async_delete_mqtt_disconnect_issue(hass, entry.entry_id)
         async_delete_controller_lost_issue(hass, entry.entry_id)
         async_delete_cloud_token_expired_issue(hass, entry.entry_id)
-        if domain_data is not None and not domain_data:
-            hass.data.pop(DOMAIN, None)
+        # Services are shared by all entries; drop them with the last loaded one
+        if not any(
+            other.state is ConfigEntryState.LOADED
+            for other in hass.config_entries.async_entries(DOMAIN)
+            if other.entry_id != entry.entry_id
+        ):
             async_unregister_services(hass)
 
     return unload_ok
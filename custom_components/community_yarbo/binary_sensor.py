@@ -3,21 +3,51 @@
 from __future__ import annotations
 
 import time
-from typing import Any
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from itertools import chain
+from typing import Any, ClassVar, Final
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntity,
+    BinarySensorEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_time_interval
 
-from .const import DATA_COORDINATOR, DOMAIN, HEARTBEAT_TIMEOUT_SECONDS
+from .const import CHARGING_STATES, HEARTBEAT_TIMEOUT_SECONDS
 from .coordinator import YarboDataCoordinator
 from .entity import YarboEntity
-from .telemetry import get_nested_raw_value, get_value_from_paths
+from .models import YarboTelemetry
+from .telemetry import get_value_from_paths
+
+# How often the online sensor re-checks the heartbeat age
+ONLINE_CHECK_INTERVAL: Final = timedelta(seconds=1)
+
+# Sentinel for "not yet written" (never equal to a state snapshot)
+_STATE_UNWRITTEN: Final = object()
+
+# Raw fallback paths, in priority order, for values the library may not expose
+_FOLLOW_STATE_PATHS: Final = (
+    ("StateMSG", "robot_follow_state"),
+    ("RunningStatusMSG", "robot_follow_state"),
+    ("robot_follow_state",),
+)
+_CAR_CONTROLLER_PATHS: Final = (
+    ("StateMSG", "car_controller"),
+    ("RunningStatusMSG", "car_controller"),
+    ("car_controller",),
+)
+_RAIN_SENSOR_PATHS: Final = (
+    ("RunningStatusMSG", "rain_sensor_data"),
+    ("rain_sensor_data",),
+    ("rain_sensor",),
+)
 
 
 async def async_setup_entry(
@@ -26,290 +56,274 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Yarbo binary sensors based on a config entry."""
-    coordinator = hass.data[DOMAIN][entry.entry_id][DATA_COORDINATOR]
+    coordinator = entry.runtime_data.coordinator
     async_add_entities(
-        [
-            YarboChargingSensor(coordinator),
-            YarboProblemSensor(coordinator),
-            YarboPlanningActiveSensor(coordinator),
-            YarboReturningToChargeSensor(coordinator),
-            YarboGoingToStartSensor(coordinator),
-            YarboFollowModeSensor(coordinator),
-            YarboPlanningPausedSensor(coordinator),
-            YarboManualControllerSensor(coordinator),
-            YarboRainDetectedSensor(coordinator),
-            YarboNoChargePeriodSensor(coordinator),
-            YarboOnlineBinarySensor(coordinator),
-        ]
+        chain(
+            (cls(coordinator) for cls in _BINARY_SENSORS),
+            (YarboFlagBinarySensor(coordinator, d) for d in FLAG_BINARY_SENSORS),
+        )
     )
 
 
 class YarboBinarySensor(YarboEntity, BinarySensorEntity):
-    """Base binary sensor for Yarbo."""
+    """Base binary sensor for Yarbo.
+
+    Telemetry-backed subclasses implement ``_is_on_from``; the result is
+    memoised per telemetry frame (the coordinator publishes a new object for
+    every frame), so repeated state reads between updates skip the
+    attribute/raw-path lookups. Sensors driven by other coordinator state
+    override ``is_on`` directly.
+    """
+
+    # (telemetry frame, derived state) from the last evaluation
+    _is_on_memo: tuple[YarboTelemetry, bool | None] | None = None
+    # Snapshot of what was last written to the state machine
+    _last_written_state: Any = _STATE_UNWRITTEN
+    # Set by ``class X(YarboBinarySensor, entity_key=...)``
+    _default_entity_key: ClassVar[str]
+
+    def __init_subclass__(cls, *, entity_key: str | None = None, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if entity_key is not None:
+            cls._default_entity_key = entity_key
+
+    def __init__(self, coordinator: YarboDataCoordinator, entity_key: str | None = None) -> None:
+        super().__init__(
+            coordinator, self._default_entity_key if entity_key is None else entity_key
+        )
+
+    def _state_snapshot(self) -> tuple[Any, ...]:
+        """Return everything that ends up in the written state."""
+        return (self.available, self.is_on)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Only write state when availability or is_on actually changed."""
+        self._async_write_state_if_changed()
+
+    @callback
+    def _async_write_state_if_changed(self) -> None:
+        """Write state unless it matches the last written snapshot."""
+        snapshot = self._state_snapshot()
+        if snapshot == self._last_written_state:
+            return
+        self._last_written_state = snapshot
+        self.async_write_ha_state()
+
+    def _is_on_from(self, telemetry: YarboTelemetry) -> bool | None:
+        """Derive the state from a telemetry frame; unknown unless overridden."""
+        return None
 
-    def __init__(self, coordinator: YarboDataCoordinator, entity_key: str) -> None:
-        super().__init__(coordinator, entity_key)
+    @property
+    def is_on(self) -> bool | None:
+        """Return the state for the current telemetry frame."""
+        telemetry = self.telemetry
+        if not telemetry:
+            return None
+        memo = self._is_on_memo
+        if memo is not None and memo[0] is telemetry:
+            return memo[1]
+        value = self._is_on_from(telemetry)
+        self._is_on_memo = (telemetry, value)
+        return value
 
 
-class YarboChargingSensor(YarboBinarySensor):
+class YarboChargingSensor(YarboBinarySensor, entity_key="charging"):
     """Charging status sensor."""
 
     _attr_device_class = BinarySensorDeviceClass.BATTERY_CHARGING
     _attr_translation_key = "charging"
 
-    def __init__(self, coordinator: YarboDataCoordinator) -> None:
-        super().__init__(coordinator, "charging")
-
-    @property
-    def is_on(self) -> bool | None:
+    def _is_on_from(self, telemetry: YarboTelemetry) -> bool | None:
         """Return True when charging."""
-        if not self.telemetry:
-            return None
-        return self.telemetry.charging_status in (1, 2, 3)
+        return telemetry.charging_status in CHARGING_STATES
 
 
-class YarboProblemSensor(YarboBinarySensor):
+class YarboProblemSensor(YarboBinarySensor, entity_key="problem"):
     """Problem indicator sensor."""
 
     _attr_device_class = BinarySensorDeviceClass.PROBLEM
     _attr_translation_key = "problem"
 
-    def __init__(self, coordinator: YarboDataCoordinator) -> None:
-        super().__init__(coordinator, "problem")
-
-    @property
-    def is_on(self) -> bool | None:
+    def _is_on_from(self, telemetry: YarboTelemetry) -> bool | None:
         """Return True when an error is present."""
-        if not self.telemetry:
-            return None
-        return self.telemetry.error_code != 0
-
-
-class YarboPlanningActiveSensor(YarboBinarySensor):
-    """Planning active sensor."""
-
-    _attr_entity_registry_enabled_default = False
-    _attr_translation_key = "planning_active"
-
-    def __init__(self, coordinator: YarboDataCoordinator) -> None:
-        super().__init__(coordinator, "planning_active")
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return True when planning is active."""
-        telemetry = self.telemetry
-        if not telemetry:
-            return None
-        value = getattr(telemetry, "on_going_planning", None)
-        if value is None:
-            value = get_nested_raw_value(telemetry, "StateMSG", "on_going_planning")
-        if value is None:
-            return None
-        return value != 0
+        return telemetry.error_code != 0
 
 
-class YarboReturningToChargeSensor(YarboBinarySensor):
-    """Returning to charge sensor."""
+@dataclass(frozen=True, kw_only=True)
+class YarboFlagBinarySensorEntityDescription(BinarySensorEntityDescription):
+    """Describes a binary sensor that is on when a telemetry flag is non-zero."""
 
-    _attr_entity_registry_enabled_default = False
-    _attr_translation_key = "returning_to_charge"
+    # Telemetry attribute, tried first
+    value_attr: str
+    # Raw fallback paths, in priority order, when the attribute is missing
+    raw_paths: tuple[tuple[str, ...], ...]
 
-    def __init__(self, coordinator: YarboDataCoordinator) -> None:
-        super().__init__(coordinator, "returning_to_charge")
 
-    @property
-    def is_on(self) -> bool | None:
-        """Return True when returning to charge."""
-        telemetry = self.telemetry
-        if not telemetry:
-            return None
-        value = getattr(telemetry, "on_going_recharging", None)
-        if value is None:
-            value = get_nested_raw_value(telemetry, "StateMSG", "on_going_recharging")
-        if value is None:
-            return None
-        return value != 0
+class YarboFlagBinarySensor(YarboBinarySensor):
+    """Binary sensor for a non-zero telemetry flag."""
 
+    entity_description: YarboFlagBinarySensorEntityDescription
 
-class YarboGoingToStartSensor(YarboBinarySensor):
-    """Going to start point sensor."""
-
-    _attr_entity_registry_enabled_default = False
-    _attr_translation_key = "going_to_start"
+    def __init__(
+        self,
+        coordinator: YarboDataCoordinator,
+        description: YarboFlagBinarySensorEntityDescription,
+    ) -> None:
+        super().__init__(coordinator, description.key)
+        self.entity_description = description
 
-    def __init__(self, coordinator: YarboDataCoordinator) -> None:
-        super().__init__(coordinator, "going_to_start")
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return True when going to start point."""
-        telemetry = self.telemetry
-        if not telemetry:
-            return None
-        value = getattr(telemetry, "on_going_to_start_point", None)
+    def _is_on_from(self, telemetry: YarboTelemetry) -> bool | None:
+        """Return True when the flag is set."""
+        description = self.entity_description
+        value = getattr(telemetry, description.value_attr, None)
         if value is None:
-            value = get_nested_raw_value(telemetry, "StateMSG", "on_going_to_start_point")
+            value = get_value_from_paths(telemetry, description.raw_paths)
         if value is None:
             return None
         return value != 0
 
 
-class YarboFollowModeSensor(YarboBinarySensor):
-    """Follow mode sensor."""
-
-    _attr_entity_registry_enabled_default = False
-    _attr_translation_key = "follow_mode"
-
-    def __init__(self, coordinator: YarboDataCoordinator) -> None:
-        super().__init__(coordinator, "follow_mode")
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return True when robot follow mode is active."""
-        telemetry = self.telemetry
-        if not telemetry:
-            return None
-        value = getattr(telemetry, "robot_follow_state", None)
-        if value is None:
-            value = get_value_from_paths(
-                telemetry,
-                [
-                    ("StateMSG", "robot_follow_state"),
-                    ("RunningStatusMSG", "robot_follow_state"),
-                    ("robot_follow_state",),
-                ],
-            )
-        if value is None:
-            return None
-        return value != 0
-
-
-class YarboPlanningPausedSensor(YarboBinarySensor):
-    """Planning paused sensor."""
-
-    _attr_entity_registry_enabled_default = False
-    _attr_translation_key = "planning_paused"
-
-    def __init__(self, coordinator: YarboDataCoordinator) -> None:
-        super().__init__(coordinator, "planning_paused")
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return True when planning is paused."""
-        telemetry = self.telemetry
-        if not telemetry:
-            return None
-        value = getattr(telemetry, "planning_paused", None)
-        if value is None:
-            value = get_nested_raw_value(telemetry, "StateMSG", "planning_paused")
-        if value is None:
-            return None
-        return value != 0
-
-
-class YarboManualControllerSensor(YarboBinarySensor):
-    """Manual controller sensor."""
-
-    _attr_entity_registry_enabled_default = False
-    _attr_translation_key = "manual_controller"
-
-    def __init__(self, coordinator: YarboDataCoordinator) -> None:
-        super().__init__(coordinator, "manual_controller")
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return True when manual controller is active."""
-        telemetry = self.telemetry
-        if not telemetry:
-            return None
-        value = getattr(telemetry, "car_controller", None)
-        if value is None:
-            value = get_value_from_paths(
-                telemetry,
-                [
-                    ("StateMSG", "car_controller"),
-                    ("RunningStatusMSG", "car_controller"),
-                    ("car_controller",),
-                ],
-            )
-        if value is None:
-            return None
-        return value != 0
-
-
-class YarboRainDetectedSensor(YarboBinarySensor):
-    """Rain detected sensor."""
-
-    _attr_device_class = BinarySensorDeviceClass.MOISTURE
-    _attr_entity_registry_enabled_default = False
-    _attr_translation_key = "rain_detected"
-
-    def __init__(self, coordinator: YarboDataCoordinator) -> None:
-        super().__init__(coordinator, "rain_detected")
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return True when rain is detected."""
-        telemetry = self.telemetry
-        if not telemetry:
-            return None
-        value = getattr(telemetry, "rain_sensor", None)
-        if value is None:
-            value = get_value_from_paths(
-                telemetry,
-                [
-                    ("RunningStatusMSG", "rain_sensor_data"),
-                    ("rain_sensor_data",),
-                    ("rain_sensor",),
-                ],
-            )
-        if value is None:
-            return None
-        return value != 0
+FLAG_BINARY_SENSORS: tuple[YarboFlagBinarySensorEntityDescription, ...] = (
+    YarboFlagBinarySensorEntityDescription(
+        key="planning_active",
+        translation_key="planning_active",
+        entity_registry_enabled_default=False,
+        value_attr="on_going_planning",
+        raw_paths=(("StateMSG", "on_going_planning"),),
+    ),
+    YarboFlagBinarySensorEntityDescription(
+        key="returning_to_charge",
+        translation_key="returning_to_charge",
+        entity_registry_enabled_default=False,
+        value_attr="on_going_recharging",
+        raw_paths=(("StateMSG", "on_going_recharging"),),
+    ),
+    YarboFlagBinarySensorEntityDescription(
+        key="going_to_start",
+        translation_key="going_to_start",
+        entity_registry_enabled_default=False,
+        value_attr="on_going_to_start_point",
+        raw_paths=(("StateMSG", "on_going_to_start_point"),),
+    ),
+    YarboFlagBinarySensorEntityDescription(
+        key="follow_mode",
+        translation_key="follow_mode",
+        entity_registry_enabled_default=False,
+        value_attr="robot_follow_state",
+        raw_paths=_FOLLOW_STATE_PATHS,
+    ),
+    YarboFlagBinarySensorEntityDescription(
+        key="planning_paused",
+        translation_key="planning_paused",
+        entity_registry_enabled_default=False,
+        value_attr="planning_paused",
+        raw_paths=(("StateMSG", "planning_paused"),),
+    ),
+    YarboFlagBinarySensorEntityDescription(
+        key="manual_controller",
+        translation_key="manual_controller",
+        entity_registry_enabled_default=False,
+        value_attr="car_controller",
+        raw_paths=_CAR_CONTROLLER_PATHS,
+    ),
+    YarboFlagBinarySensorEntityDescription(
+        key="rain_detected",
+        translation_key="rain_detected",
+        device_class=BinarySensorDeviceClass.MOISTURE,
+        entity_registry_enabled_default=False,
+        value_attr="rain_sensor",
+        raw_paths=_RAIN_SENSOR_PATHS,
+    ),
+)
 
 
-class YarboNoChargePeriodSensor(YarboBinarySensor):
+class YarboNoChargePeriodSensor(YarboBinarySensor, entity_key="no_charge_period"):
     """No-charge period active sensor."""
 
     _attr_translation_key = "no_charge_period"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_entity_registry_enabled_default = False
 
-    def __init__(self, coordinator: YarboDataCoordinator) -> None:
-        super().__init__(coordinator, "no_charge_period")
+    # (start, end, periods, attrs) from the last extra_state_attributes build
+    _attrs_cache: tuple[str | None, str | None, list[Any] | None, dict[str, Any]] | None = None
 
     @property
     def is_on(self) -> bool | None:
         """Return True when a no-charge period is active."""
         return self.coordinator.no_charge_period_active
 
+    def _state_snapshot(self) -> tuple[Any, ...]:
+        """Include the period details, which can change while is_on does not."""
+        return (*super()._state_snapshot(), self.extra_state_attributes)
+
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return no-charge period details."""
+        coordinator = self.coordinator
+        start = coordinator.no_charge_period_start
+        end = coordinator.no_charge_period_end
+        periods = coordinator.no_charge_periods
+        # The coordinator replaces (never mutates) the periods list on each
+        # no-charge update, so identity plus the two time strings identify
+        # the attribute set.
+        cached = self._attrs_cache
+        if cached is not None and cached[0] == start and cached[1] == end and cached[2] is periods:
+            return cached[3]
         attrs: dict[str, Any] = {}
-        if self.coordinator.no_charge_period_start:
-            attrs["start_time"] = self.coordinator.no_charge_period_start
-        if self.coordinator.no_charge_period_end:
-            attrs["end_time"] = self.coordinator.no_charge_period_end
-        periods = self.coordinator.no_charge_periods
+        if start:
+            attrs["start_time"] = start
+        if end:
+            attrs["end_time"] = end
         if periods:
             attrs["periods"] = periods
+        self._attrs_cache = (start, end, periods, attrs)
         return attrs
 
 
-class YarboOnlineBinarySensor(YarboBinarySensor):
+class YarboOnlineBinarySensor(YarboBinarySensor, entity_key="online"):
     """Binary sensor that is ON when the robot sent telemetry within HEARTBEAT_TIMEOUT_SECONDS."""
 
     _attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
     _attr_translation_key = "online"
 
     def __init__(self, coordinator: YarboDataCoordinator) -> None:
-        super().__init__(coordinator, "online")
+        super().__init__(coordinator)
+        self._attr_is_on = self._compute_online()
 
-    @property
-    def is_on(self) -> bool:
+    def _compute_online(self) -> bool:
         """Return True if last telemetry was received within HEARTBEAT_TIMEOUT_SECONDS."""
         last_seen = self.coordinator.last_seen
         if last_seen is None:
             return False
         return time.monotonic() - last_seen < HEARTBEAT_TIMEOUT_SECONDS
+
+    async def async_added_to_hass(self) -> None:
+        """Re-check the heartbeat on a fixed interval, independent of telemetry rate."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_track_time_interval(self.hass, self._async_check_online, ONLINE_CHECK_INTERVAL)
+        )
+
+    @callback
+    def _async_check_online(self, _now: datetime) -> None:
+        """Recompute the online state and write it only when it flipped."""
+        online = self._compute_online()
+        if online == self._attr_is_on:
+            return
+        self._attr_is_on = online
+        self._async_write_state_if_changed()
+
+    @property
+    def is_on(self) -> bool:
+        """Return the online state evaluated at the last interval check."""
+        return self._attr_is_on
+
+
+# Entities created for every config entry, in registration order
+_BINARY_SENSORS: tuple[Callable[[YarboDataCoordinator], YarboBinarySensor], ...] = (
+    YarboChargingSensor,
+    YarboProblemSensor,
+    YarboNoChargePeriodSensor,
+    YarboOnlineBinarySensor,
+)
@@ -11,6 +11,7 @@ from homeassistant.components import dhcp
 from homeassistant.config_entries import ConfigEntry, ConfigFlow, OptionsFlow
 from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
+from homeassistant.helpers.device_registry import format_mac
 from yarbo import YarboLocalClient
 from yarbo.exceptions import YarboConnectionError
 
@@ -20,6 +21,10 @@ except ImportError:  # pragma: no cover — older python-yarbo
     discover_yarbo = None
 
 
+# How long the MQTT test waits for the robot's first telemetry frame
+MQTT_TEST_TELEMETRY_TIMEOUT = 30.0
+
+
 def _run_mqtt_test_sync(host: str, port: int) -> tuple[Any, str | None]:
     """Run MQTT connect + first telemetry + disconnect in a thread.
 
@@ -53,7 +58,8 @@ def _run_mqtt_test_sync(host: str, port: int) -> tuple[Any, str | None]:
             await client.connect()
             async_gen = client.watch_telemetry()
             try:
-                telemetry = await asyncio.wait_for(async_gen.__anext__(), timeout=30.0)
+                async with asyncio.timeout(MQTT_TEST_TELEMETRY_TIMEOUT):
+                    telemetry = await anext(async_gen)
                 serial = (
                     (getattr(telemetry, "serial_number", None) if telemetry else None)
                     or getattr(client, "serial_number", None)
@@ -61,9 +67,17 @@ def _run_mqtt_test_sync(host: str, port: int) -> tuple[Any, str | None]:
                 )
                 return telemetry, (serial or "").strip() or None
             finally:
-                await async_gen.aclose()
+                # Cleanup errors must not mask the test result or its real failure
+                try:
+                    await async_gen.aclose()
+                except Exception as err:
+                    _LOGGER.debug("Closing MQTT test telemetry stream failed: %s", err)
         finally:
-            await client.disconnect()
+            try:
+                async with asyncio.timeout(5.0):
+                    await client.disconnect()
+            except Exception as err:
+                _LOGGER.debug("Disconnecting MQTT test client failed: %s", err)
 
     return asyncio.run(_test())
 
@@ -107,12 +121,16 @@ from .const import (  # noqa: E402
     OPT_TELEMETRY_THROTTLE,
     POLL_INTERVAL_MAX,
     POLL_INTERVAL_MIN,
+    coerce_broker_port,
 )
 from .discovery import YarboEndpoint, async_discover_endpoints  # noqa: E402
 from .repairs import async_delete_cloud_token_expired_issue  # noqa: E402
 
 _LOGGER = logging.getLogger(__name__)
 
+# Upper bound for a cloud login so a slow auth endpoint cannot hang the form
+CLOUD_LOGIN_TIMEOUT = 15.0
+
 STEP_USER_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_BROKER_HOST): str,
@@ -120,6 +138,24 @@ STEP_USER_SCHEMA = vol.Schema(
     }
 )
 
+# No port default: a cleared port keeps the entry's current port
+STEP_RECONFIGURE_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_BROKER_HOST): str,
+        vol.Optional(CONF_BROKER_PORT): int,
+    }
+)
+
+# An omitted name falls back to the robot's own name (or "Yarbo <last 4 of SN>")
+STEP_NAME_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_ROBOT_NAME): str,
+    }
+)
+
+# Retry form shown when the MQTT test fails
+STEP_MQTT_TEST_SCHEMA = vol.Schema({})
+
 STEP_CLOUD_SCHEMA = vol.Schema(
     {
         vol.Optional(CONF_CLOUD_USERNAME, default=""): str,
@@ -133,6 +169,28 @@ STEP_REAUTH_SCHEMA = vol.Schema(
     }
 )
 
+# Current option values are filled in as suggested values when the form is shown
+OPTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(OPT_TELEMETRY_THROTTLE, default=DEFAULT_TELEMETRY_THROTTLE): vol.All(
+            vol.Coerce(float), vol.Range(min=1.0, max=10.0)
+        ),
+        vol.Optional(OPT_POLL_INTERVAL, default=DEFAULT_POLL_INTERVAL): vol.All(
+            vol.Coerce(int),
+            vol.Range(min=POLL_INTERVAL_MIN, max=POLL_INTERVAL_MAX),
+        ),
+        vol.Optional(OPT_POLL_ACQUIRE_CONTROLLER, default=DEFAULT_POLL_ACQUIRE_CONTROLLER): bool,
+        vol.Optional(OPT_AUTO_CONTROLLER, default=DEFAULT_AUTO_CONTROLLER): bool,
+        vol.Optional(OPT_DEBUG_LOGGING, default=DEFAULT_DEBUG_LOGGING): bool,
+        vol.Optional(OPT_MQTT_RECORDING, default=DEFAULT_MQTT_RECORDING): bool,
+        # Cloud features hidden for beta — uncomment when cloud API is tested
+        # vol.Optional(OPT_CLOUD_ENABLED, default=DEFAULT_CLOUD_ENABLED): bool,
+        # Fixed: activity_personality is a boolean toggle, not an enum string
+        vol.Optional(OPT_ACTIVITY_PERSONALITY, default=DEFAULT_ACTIVITY_PERSONALITY): bool,
+        vol.Optional(OPT_ERROR_REPORTING, default=DEFAULT_ERROR_REPORTING): bool,
+    }
+)
+
 
 class YarboConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Yarbo.
@@ -170,7 +228,7 @@ class YarboConfigFlow(ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             self._broker_host = user_input[CONF_BROKER_HOST]
             port = user_input.get(CONF_BROKER_PORT)
-            self._broker_port = DEFAULT_BROKER_PORT if port in (None, "") else int(port)
+            self._broker_port = coerce_broker_port(port)
             # Discover other endpoints (e.g. YARBO hostname); if multiple, show selection
             self._discovered_endpoints = await async_discover_endpoints(
                 seed_host=self._broker_host,
@@ -179,13 +237,7 @@ class YarboConfigFlow(ConfigFlow, domain=DOMAIN):
             if len(self._discovered_endpoints) > 1:
                 return await self.async_step_select_endpoint()
             if self._discovered_endpoints:
-                ep = self._discovered_endpoints[0]
-                self._broker_host = ep.host
-                self._broker_port = ep.port
-                self._connection_path = ep.endpoint_type
-                self._rover_ip = ep.host if ep.endpoint_type == ENDPOINT_TYPE_ROVER else None
-                self._alternate_host = None
-                self._broker_endpoints_ordered = [e.host for e in self._discovered_endpoints]
+                self._accept_endpoint(self._discovered_endpoints[0])
             return await self.async_step_mqtt_test()
 
         # No user input yet: try python-yarbo discovery (no seed)
@@ -205,13 +257,7 @@ class YarboConfigFlow(ConfigFlow, domain=DOMAIN):
             # No devices found — offer manual IP/port entry
             return await self.async_step_manual()
         if len(self._discovered_endpoints) == 1:
-            ep = self._discovered_endpoints[0]
-            self._broker_host = ep.host
-            self._broker_port = ep.port
-            self._connection_path = ep.endpoint_type
-            self._rover_ip = ep.host if ep.endpoint_type == ENDPOINT_TYPE_ROVER else None
-            self._alternate_host = None
-            self._broker_endpoints_ordered = [ep.host]
+            self._accept_endpoint(self._discovered_endpoints[0])
             return await self.async_step_mqtt_test()
         # Multiple endpoints — preserve library order (Primary, Secondary, ...)
         self._broker_endpoints_ordered = [ep.host for ep in self._discovered_endpoints]
@@ -224,7 +270,7 @@ class YarboConfigFlow(ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             self._broker_host = user_input[CONF_BROKER_HOST]
             port = user_input.get(CONF_BROKER_PORT)
-            self._broker_port = DEFAULT_BROKER_PORT if port in (None, "") else int(port)
+            self._broker_port = coerce_broker_port(port)
             self._connection_path = ""
             self._alternate_host = None
             self._rover_ip = None
@@ -283,6 +329,8 @@ class YarboConfigFlow(ConfigFlow, domain=DOMAIN):
             ip = discovery_info.ip
             mac = discovery_info.macaddress
             hostname = discovery_info.hostname
+        # DHCP reports "aabbcc..." and the ARP scan "aa:bb:cc:..."; compare and store one form
+        mac = format_mac(mac) if mac else ""
 
         # MAC is a hardware identifier — log only last octet to avoid leaking full address
         _LOGGER.debug(
@@ -307,20 +355,13 @@ class YarboConfigFlow(ConfigFlow, domain=DOMAIN):
             self._abort_if_unique_id_configured(updates={CONF_BROKER_HOST: ip})
 
         # Check by MAC address for IP changes (reconfigure)
-        existing_entry = next(
-            (
-                entry
-                for entry in self._async_current_entries()
-                if entry.data.get(CONF_BROKER_MAC) == mac
-            ),
-            None,
-        )
+        existing_entry = self._entries_by_mac().get(mac) if mac else None
         if existing_entry is not None:
             if existing_entry.data.get(CONF_BROKER_HOST) != ip:
                 self._reconfigure_entry = existing_entry
                 self._broker_host = ip
                 port = existing_entry.data.get(CONF_BROKER_PORT)
-                self._broker_port = DEFAULT_BROKER_PORT if port in (None, "") else int(port)
+                self._broker_port = coerce_broker_port(port)
                 return await self.async_step_reconfigure()
             return self.async_abort(reason="already_configured")
 
@@ -349,17 +390,33 @@ class YarboConfigFlow(ConfigFlow, domain=DOMAIN):
             self._broker_endpoints_ordered = [ep.host for ep in self._discovered_endpoints]
             return await self.async_step_select_endpoint()
 
-        # Single endpoint
-        ep = self._discovered_endpoints[0]
+        self._accept_endpoint(self._discovered_endpoints[0])
+
+        # Go to confirm step — if SN is known it skips MQTT test, otherwise falls through
+        return await self.async_step_confirm()
+
+    def _accept_endpoint(self, ep: YarboEndpoint) -> None:
+        """Connect through ``ep``, keeping the other discovered endpoints for failover."""
         self._broker_host = ep.host
         self._broker_port = ep.port
         self._connection_path = ep.endpoint_type
-        self._rover_ip = ep.host if ep.endpoint_type == ENDPOINT_TYPE_ROVER else None
-        self._alternate_host = None
-        self._broker_endpoints_ordered = [ep.host]
+        others = [e for e in self._discovered_endpoints if e.host != ep.host]
+        self._alternate_host = others[0].host if others else None
+        self._rover_ip = next(
+            (e.host for e in self._discovered_endpoints if e.endpoint_type == ENDPOINT_TYPE_ROVER),
+            None,
+        )
+        # Keep discovery order for failover (Primary → Secondary → Primary …)
+        self._broker_endpoints_ordered = [e.host for e in self._discovered_endpoints]
 
-        # Go to confirm step — if SN is known it skips MQTT test, otherwise falls through
-        return await self.async_step_confirm()
+    @callback
+    def _entries_by_mac(self) -> dict[str, ConfigEntry]:
+        """Return configured entries keyed by their stored broker MAC (``format_mac`` form)."""
+        return {
+            format_mac(mac): entry
+            for entry in self._async_current_entries()
+            if (mac := entry.data.get(CONF_BROKER_MAC))
+        }
 
     async def async_step_select_endpoint(
         self, user_input: dict[str, Any] | None = None
@@ -368,27 +425,9 @@ class YarboConfigFlow(ConfigFlow, domain=DOMAIN):
         # Defensive: HA may call async_step_user with form data in edge cases
         if user_input is not None:
             chosen_host = user_input.get("selected_endpoint")
-            chosen: YarboEndpoint | None = None
-            for ep in self._discovered_endpoints:
-                if ep.host == chosen_host:
-                    chosen = ep
-                    break
+            chosen = next((ep for ep in self._discovered_endpoints if ep.host == chosen_host), None)
             if chosen:
-                self._broker_host = chosen.host
-                self._broker_port = chosen.port
-                self._connection_path = chosen.endpoint_type
-                others = [e for e in self._discovered_endpoints if e.host != chosen.host]
-                self._alternate_host = others[0].host if others else None
-                self._rover_ip = next(
-                    (
-                        e.host
-                        for e in self._discovered_endpoints
-                        if e.endpoint_type == ENDPOINT_TYPE_ROVER
-                    ),
-                    None,
-                )
-                # Keep discovery order for failover (Primary → Secondary → Primary …)
-                self._broker_endpoints_ordered = [ep.host for ep in self._discovered_endpoints]
+                self._accept_endpoint(chosen)
             return await self.async_step_mqtt_test()
 
         # Build options in library order; label first as Primary, second as Secondary (like DNS)
@@ -449,7 +488,8 @@ class YarboConfigFlow(ConfigFlow, domain=DOMAIN):
             )
         except YarboConnectionError:
             errors["base"] = "cannot_connect"
-        except TimeoutError:
+        except (TimeoutError, StopAsyncIteration):
+            # No frame in time, or the telemetry stream ended before the first one
             errors["base"] = "no_telemetry"
         except Exception:
             _LOGGER.exception("Failed to decode Yarbo telemetry")
@@ -458,14 +498,14 @@ class YarboConfigFlow(ConfigFlow, domain=DOMAIN):
         if errors:
             return self.async_show_form(
                 step_id="mqtt_test",
-                data_schema=vol.Schema({}),
+                data_schema=STEP_MQTT_TEST_SCHEMA,
                 errors=errors,
             )
 
         if not self._robot_serial:
             return self.async_show_form(
                 step_id="mqtt_test",
-                data_schema=vol.Schema({}),
+                data_schema=STEP_MQTT_TEST_SCHEMA,
                 errors={"base": "no_telemetry"},
             )
 
@@ -473,22 +513,25 @@ class YarboConfigFlow(ConfigFlow, domain=DOMAIN):
             if self._robot_serial != self._reconfigure_entry.data.get(CONF_ROBOT_SERIAL):
                 return self.async_abort(reason="wrong_device")
 
-            data = dict(self._reconfigure_entry.data)
-            data[CONF_BROKER_HOST] = self._broker_host
+            entry_data = self._reconfigure_entry.data
             if self._broker_endpoints_ordered:
-                data[CONF_BROKER_ENDPOINTS] = self._broker_endpoints_ordered
+                endpoints = self._broker_endpoints_ordered
             else:
                 # Preserve existing endpoints, updating the primary host
-                existing = list(data.get(CONF_BROKER_ENDPOINTS, []))
-                old_host = self._reconfigure_entry.data.get(CONF_BROKER_HOST)
-                if old_host in existing:
-                    existing[existing.index(old_host)] = self._broker_host
-                elif existing:
-                    existing[0] = self._broker_host
+                endpoints = list(entry_data.get(CONF_BROKER_ENDPOINTS, []))
+                old_host = entry_data.get(CONF_BROKER_HOST)
+                if old_host in endpoints:
+                    endpoints[endpoints.index(old_host)] = self._broker_host
+                elif endpoints:
+                    endpoints[0] = self._broker_host
                 else:
-                    existing = [self._broker_host]
-                data[CONF_BROKER_ENDPOINTS] = existing
-            data[CONF_BROKER_PORT] = self._broker_port
+                    endpoints = [self._broker_host]
+            data = {
+                **entry_data,
+                CONF_BROKER_HOST: self._broker_host,
+                CONF_BROKER_ENDPOINTS: endpoints,
+                CONF_BROKER_PORT: self._broker_port,
+            }
             if self._discovered_mac:
                 data[CONF_BROKER_MAC] = self._discovered_mac
             self.hass.config_entries.async_update_entry(self._reconfigure_entry, data=data)
@@ -509,8 +552,10 @@ class YarboConfigFlow(ConfigFlow, domain=DOMAIN):
         # Defensive: HA may call async_step_user with form data in edge cases
         if user_input is not None:
             self._broker_host = user_input[CONF_BROKER_HOST]
-            port = user_input.get(CONF_BROKER_PORT)
-            self._broker_port = DEFAULT_BROKER_PORT if port in (None, "") else int(port)
+            port = user_input.get(
+                CONF_BROKER_PORT, self._reconfigure_entry.data.get(CONF_BROKER_PORT)
+            )
+            self._broker_port = coerce_broker_port(port)
             return await self.async_step_mqtt_test()
 
         port = (
@@ -518,18 +563,13 @@ class YarboConfigFlow(ConfigFlow, domain=DOMAIN):
             if self._broker_host is not None
             else self._reconfigure_entry.data.get(CONF_BROKER_PORT)
         )
-        schema = vol.Schema(
+        schema = self.add_suggested_values_to_schema(
+            STEP_RECONFIGURE_SCHEMA,
             {
-                vol.Required(
-                    CONF_BROKER_HOST,
-                    default=self._broker_host
-                    or self._reconfigure_entry.data.get(CONF_BROKER_HOST, ""),
-                ): str,
-                vol.Optional(
-                    CONF_BROKER_PORT,
-                    default=int(port if port is not None else DEFAULT_BROKER_PORT),
-                ): int,
-            }
+                CONF_BROKER_HOST: self._broker_host
+                or self._reconfigure_entry.data.get(CONF_BROKER_HOST, ""),
+                CONF_BROKER_PORT: coerce_broker_port(port),
+            },
         )
         return self.async_show_form(step_id="reconfigure", data_schema=schema)
 
@@ -574,10 +614,8 @@ class YarboConfigFlow(ConfigFlow, domain=DOMAIN):
                 data=entry_data,
             )
 
-        schema = vol.Schema(
-            {
-                vol.Optional(CONF_ROBOT_NAME, default=default_name): str,
-            }
+        schema = self.add_suggested_values_to_schema(
+            STEP_NAME_SCHEMA, {CONF_ROBOT_NAME: default_name}
         )
         return self.async_show_form(step_id="name", data_schema=schema)
 
@@ -610,11 +648,15 @@ class YarboConfigFlow(ConfigFlow, domain=DOMAIN):
             else:
                 cloud_client = YarboCloudClient(username=username, password=password)
                 try:
-                    await cloud_client.connect()
+                    async with asyncio.timeout(CLOUD_LOGIN_TIMEOUT):
+                        await cloud_client.connect()
                     refresh_token = cloud_client.auth.refresh_token
                     self._pending_data[CONF_CLOUD_USERNAME] = username
                     self._pending_data[CONF_CLOUD_REFRESH_TOKEN] = refresh_token
                     _LOGGER.debug("Cloud auth succeeded for %s", username)
+                except TimeoutError:
+                    _LOGGER.debug("Cloud login timed out for %s", username)
+                    errors["base"] = "cloud_timeout"
                 except Exception as err:
                     _LOGGER.exception("Cloud authentication failed for %s: %s", username, err)
                     errors["base"] = "cloud_auth_failed"
@@ -656,7 +698,8 @@ class YarboConfigFlow(ConfigFlow, domain=DOMAIN):
             else:
                 cloud_client = YarboCloudClient(username=username, password=password)
                 try:
-                    await cloud_client.connect()
+                    async with asyncio.timeout(CLOUD_LOGIN_TIMEOUT):
+                        await cloud_client.connect()
                     refresh_token = cloud_client.auth.refresh_token
                     new_data = dict(reauth_entry.data)
                     new_data[CONF_CLOUD_REFRESH_TOKEN] = refresh_token
@@ -664,6 +707,9 @@ class YarboConfigFlow(ConfigFlow, domain=DOMAIN):
                     async_delete_cloud_token_expired_issue(self.hass, reauth_entry.entry_id)
                     await self.hass.config_entries.async_reload(reauth_entry.entry_id)
                     return self.async_abort(reason="reauth_successful")
+                except TimeoutError:
+                    _LOGGER.debug("Cloud re-authentication timed out for %s", username)
+                    errors["base"] = "cloud_timeout"
                 except Exception as err:
                     _LOGGER.exception("Re-authentication failed for %s: %s", username, err)
                     errors["base"] = "cloud_auth_failed"
@@ -701,68 +747,5 @@ class YarboOptionsFlow(OptionsFlow):
         if user_input is not None:
             return self.async_create_entry(title="", data=user_input)
 
-        schema = vol.Schema(
-            {
-                vol.Optional(
-                    OPT_TELEMETRY_THROTTLE,
-                    default=self._config_entry.options.get(
-                        OPT_TELEMETRY_THROTTLE, DEFAULT_TELEMETRY_THROTTLE
-                    ),
-                ): vol.All(vol.Coerce(float), vol.Range(min=1.0, max=10.0)),
-                vol.Optional(
-                    OPT_POLL_INTERVAL,
-                    default=self._config_entry.options.get(
-                        OPT_POLL_INTERVAL, DEFAULT_POLL_INTERVAL
-                    ),
-                ): vol.All(
-                    vol.Coerce(int),
-                    vol.Range(min=POLL_INTERVAL_MIN, max=POLL_INTERVAL_MAX),
-                ),
-                vol.Optional(
-                    OPT_POLL_ACQUIRE_CONTROLLER,
-                    default=self._config_entry.options.get(
-                        OPT_POLL_ACQUIRE_CONTROLLER, DEFAULT_POLL_ACQUIRE_CONTROLLER
-                    ),
-                ): bool,
-                vol.Optional(
-                    OPT_AUTO_CONTROLLER,
-                    default=self._config_entry.options.get(
-                        OPT_AUTO_CONTROLLER, DEFAULT_AUTO_CONTROLLER
-                    ),
-                ): bool,
-                vol.Optional(
-                    OPT_DEBUG_LOGGING,
-                    default=self._config_entry.options.get(
-                        OPT_DEBUG_LOGGING, DEFAULT_DEBUG_LOGGING
-                    ),
-                ): bool,
-                vol.Optional(
-                    OPT_MQTT_RECORDING,
-                    default=self._config_entry.options.get(
-                        OPT_MQTT_RECORDING, DEFAULT_MQTT_RECORDING
-                    ),
-                ): bool,
-                # Cloud features hidden for beta — uncomment when cloud API is tested
-                # vol.Optional(
-                #     OPT_CLOUD_ENABLED,
-                #     default=self._config_entry.options.get(
-                #         OPT_CLOUD_ENABLED, DEFAULT_CLOUD_ENABLED
-                #     ),
-                # ): bool,
-                # Fixed: activity_personality is a boolean toggle, not an enum string
-                vol.Optional(
-                    OPT_ACTIVITY_PERSONALITY,
-                    default=self._config_entry.options.get(
-                        OPT_ACTIVITY_PERSONALITY, DEFAULT_ACTIVITY_PERSONALITY
-                    ),
-                ): bool,
-                vol.Optional(
-                    OPT_ERROR_REPORTING,
-                    default=self._config_entry.options.get(
-                        OPT_ERROR_REPORTING, DEFAULT_ERROR_REPORTING
-                    ),
-                ): bool,
-            }
-        )
-
+        schema = self.add_suggested_values_to_schema(OPTIONS_SCHEMA, self._config_entry.options)
         return self.async_show_form(step_id="init", data_schema=schema)
@@ -2,24 +2,29 @@
 
 from __future__ import annotations
 
-from .models import YarboTelemetry
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.const import Platform
+
+if TYPE_CHECKING:
+    from .models import YarboTelemetry
 
 DOMAIN = "community_yarbo"
 
 # Platforms to load
-PLATFORMS: list[str] = [
-    "sensor",
-    "binary_sensor",
-    "button",
-    "event",
-    "light",
-    "select",
-    "switch",
-    "number",
-    "device_tracker",
-    "lawn_mower",
-    "update",
-]
+PLATFORMS: tuple[Platform, ...] = (
+    Platform.SENSOR,
+    Platform.BINARY_SENSOR,
+    Platform.BUTTON,
+    Platform.EVENT,
+    Platform.LIGHT,
+    Platform.SELECT,
+    Platform.SWITCH,
+    Platform.NUMBER,
+    Platform.DEVICE_TRACKER,
+    Platform.LAWN_MOWER,
+    Platform.UPDATE,
+)
 
 # Config entry data keys
 CONF_ROBOT_SERIAL = "robot_serial"
@@ -101,16 +106,18 @@ COMMAND_REQUIRED_HEAD_TYPE: dict[str, int] = {
 }
 
 # Diagnostic commands only valid during active operation (working state)
-ACTIVE_ONLY_DIAGNOSTIC_COMMANDS: set[str] = {
-    "battery_cell_temp_msg",
-    "motor_temp_samp",
-    "body_current_msg",
-    "head_current_msg",
-    "speed_msg",
-    "odometer_msg",
-    "product_code_msg",
-    "hub_info",
-}
+ACTIVE_ONLY_DIAGNOSTIC_COMMANDS: frozenset[str] = frozenset(
+    {
+        "battery_cell_temp_msg",
+        "motor_temp_samp",
+        "body_current_msg",
+        "head_current_msg",
+        "speed_msg",
+        "odometer_msg",
+        "product_code_msg",
+        "hub_info",
+    }
+)
 
 # Robot working state values (telemetry.state field)
 WORKING_STATE_IDLE = 0
@@ -121,9 +128,18 @@ HEARTBEAT_TIMEOUT_SECONDS = 60
 # Retry delay for telemetry loop reconnection
 TELEMETRY_RETRY_DELAY_SECONDS = 30
 
-# hass.data storage keys
-DATA_COORDINATOR = "coordinator"
-DATA_CLIENT = "client"
+# telemetry.charging_status values that mean the robot is on the dock charging
+CHARGING_STATES: frozenset[int] = frozenset({1, 2, 3})
+
+# telemetry.state → activity; unlisted states are "idle"
+_STATE_ACTIVITY: dict[int, str] = {
+    1: "working",
+    2: "returning",
+    5: "paused",
+    6: "error",
+    7: "working",
+    8: "working",
+}
 
 
 def get_activity_state(telemetry: YarboTelemetry) -> str:
@@ -137,17 +153,16 @@ def get_activity_state(telemetry: YarboTelemetry) -> str:
     """
     if telemetry.error_code != 0:
         return "error"
-    if telemetry.charging_status in (1, 2, 3):
+    if telemetry.charging_status in CHARGING_STATES:
         return "charging"
-    if telemetry.state in (1, 7, 8):
-        return "working"
-    if telemetry.state == 2:
-        return "returning"
-    if telemetry.state == 5:
-        return "paused"
-    if telemetry.state == 6:
-        return "error"
-    return "idle"
+    return _STATE_ACTIVITY.get(telemetry.state, "idle")
+
+
+def coerce_broker_port(value: Any) -> int:
+    """Return the broker port from form or entry data, defaulting when missing or blank."""
+    if value is None or value == "":
+        return DEFAULT_BROKER_PORT
+    return int(value)
 
 
 def normalize_command_name(command: str) -> str:
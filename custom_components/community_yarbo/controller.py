@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+import time
+from typing import Any, Final
+from weakref import WeakKeyDictionary
 
 from homeassistant.exceptions import HomeAssistantError
 from yarbo.exceptions import YarboTimeoutError
@@ -16,11 +18,59 @@ CONTROLLER_ACQUIRE_TIMEOUT_MSG = (
     "mobile app completely if it is open, ensure the robot is online, then try again."
 )
 
+# Shown when a command is refused because the MQTT connection is down.
+ROBOT_OFFLINE_MSG = (
+    "The Yarbo robot is not connected. Check that the robot is powered on and "
+    "reachable on the network, then try again."
+)
+
+# How long a successful acquisition is reused while the library still reports
+# the role. Kept short because the mobile app can take the role back at any time.
+CONTROLLER_REUSE_SECONDS: Final = 30.0
+
+# client -> monotonic time of the last successful get_controller()
+_acquired_at: WeakKeyDictionary[Any, float] = WeakKeyDictionary()
+
+
+def raise_if_disconnected(client: Any) -> None:
+    """Fail fast instead of waiting out ``get_controller`` while the client is offline."""
+    if getattr(client, "is_connected", True) is False:
+        raise HomeAssistantError(ROBOT_OFFLINE_MSG)
 
-async def async_ensure_controller(client: Any, *, timeout: float = 5.0) -> None:
-    """Call the library ``get_controller``; map timeouts to ``HomeAssistantError``."""
+
+async def async_ensure_controller(
+    client: Any, *, timeout: float = 5.0, reuse: bool = False
+) -> None:
+    """Call the library ``get_controller``; map timeouts to ``HomeAssistantError``.
+
+    With ``reuse=True`` the MQTT round-trip is skipped when this client acquired
+    the role within the last ``CONTROLLER_REUSE_SECONDS`` and still reports
+    ``controller_acquired``. Callers that opt in must ``invalidate_controller``
+    when the command sent under the reused role fails.
+    """
+    if reuse:
+        acquired_at = _acquired_at.get(client)
+        if (
+            acquired_at is not None
+            and getattr(client, "controller_acquired", None) is True
+            and time.monotonic() - acquired_at < CONTROLLER_REUSE_SECONDS
+        ):
+            return
     try:
         await client.get_controller(timeout=timeout)
     except YarboTimeoutError as err:
+        invalidate_controller(client)
         _LOGGER.info("get_controller timed out after %.1fs: %s", timeout, err)
         raise HomeAssistantError(CONTROLLER_ACQUIRE_TIMEOUT_MSG) from err
+    except Exception:
+        invalidate_controller(client)
+        raise
+    try:
+        _acquired_at[client] = time.monotonic()
+    except TypeError:
+        pass  # Client type does not support weak references; always re-acquire
+
+
+def invalidate_controller(client: Any) -> None:
+    """Forget a reusable acquisition so the next command re-runs ``get_controller``."""
+    _acquired_at.pop(client, None)
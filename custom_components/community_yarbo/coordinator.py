@@ -28,7 +28,6 @@ from .const import (
     CONF_ROBOT_NAME,
     CONF_ROBOT_SERIAL,
     CONF_ROVER_IP,
-    DATA_CLIENT,
     DEFAULT_BROKER_PORT,
     DEFAULT_DEBUG_LOGGING,
     DEFAULT_MQTT_RECORDING,
@@ -51,7 +50,7 @@ from .const import (
     is_active_operation,
     normalize_command_name,
 )
-from .controller import async_ensure_controller
+from .controller import async_ensure_controller, invalidate_controller
 from .models import YarboTelemetry
 from .mqtt_recorder import MqttRecorder
 from .repairs import (
@@ -131,6 +130,17 @@ async def _telemetry_retry_sleep_or_stop() -> bool:
 _DIAGNOSTIC_POLL_INTERVAL_SECONDS: int = 300
 
 
+@dataclass(slots=True)
+class YarboRuntimeData:
+    """Per-entry runtime state stored on ``ConfigEntry.runtime_data``."""
+
+    client: YarboLocalClient
+    coordinator: YarboDataCoordinator
+
+
+YarboConfigEntry = ConfigEntry[YarboRuntimeData]
+
+
 @dataclass(slots=True)
 class PlanSummary:
     """Minimal work plan summary."""
@@ -624,8 +634,13 @@ class YarboDataCoordinator(DataUpdateCoordinator[YarboTelemetry]):
     async def start_plan(self, plan_id: str | int) -> None:
         """Start a work plan by id."""
         async with self.command_lock:
-            await async_ensure_controller(self.client)
-            await self.client.start_plan_direct(plan_id=plan_id, percent=self._plan_start_percent)
+            client = self.client
+            await async_ensure_controller(client, reuse=True)
+            try:
+                await client.start_plan_direct(plan_id=plan_id, percent=self._plan_start_percent)
+            except Exception:
+                invalidate_controller(client)
+                raise
         self._selected_plan_id = plan_id
         self.async_update_listeners()
         try:
@@ -638,8 +653,13 @@ class YarboDataCoordinator(DataUpdateCoordinator[YarboTelemetry]):
         if action not in {"pause", "resume", "stop"}:
             raise ValueError(f"Unsupported plan action: {action}")
         async with self.command_lock:
-            await async_ensure_controller(self.client)
-            await self.client.in_plan_action(action=action)
+            client = self.client
+            await async_ensure_controller(client, reuse=True)
+            try:
+                await client.in_plan_action(action=action)
+            except Exception:
+                invalidate_controller(client)
+                raise
 
     async def _request_data_feedback(
         self,
@@ -1297,9 +1317,9 @@ class YarboDataCoordinator(DataUpdateCoordinator[YarboTelemetry]):
                             # Disconnect old client immediately after swap to prevent leaks
                             with contextlib.suppress(Exception):
                                 await old_client.disconnect()
-                            entry_data = self.hass.data.get(DOMAIN, {})
-                            if self._entry.entry_id in entry_data:
-                                entry_data[self._entry.entry_id][DATA_CLIENT] = new_client
+                            runtime_data = getattr(self._entry, "runtime_data", None)
+                            if isinstance(runtime_data, YarboRuntimeData):
+                                runtime_data.client = new_client
                             # Persist current host so next failover uses it
                             new_data = dict(self._entry.data)
                             new_data[CONF_BROKER_HOST] = next_host
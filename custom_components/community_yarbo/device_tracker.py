@@ -9,7 +9,7 @@ from homeassistant.const import STATE_HOME, STATE_NOT_HOME
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DATA_COORDINATOR, DOMAIN, WORKING_STATE_IDLE
+from .const import WORKING_STATE_IDLE
 from .coordinator import YarboDataCoordinator
 from .entity import YarboEntity
 from .telemetry import get_gngga_data, get_nested_raw_value
@@ -21,7 +21,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Yarbo device tracker."""
-    coordinator = hass.data[DOMAIN][entry.entry_id][DATA_COORDINATOR]
+    coordinator = entry.runtime_data.coordinator
     async_add_entities([YarboDeviceTracker(coordinator)])
 
 
@@ -3,9 +3,8 @@
 from __future__ import annotations
 
 import time
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
 from .const import (
@@ -13,14 +12,14 @@ from .const import (
     CONF_CLOUD_REFRESH_TOKEN,
     CONF_CLOUD_USERNAME,
     CONF_ROBOT_SERIAL,
-    DATA_CLIENT,
-    DATA_COORDINATOR,
-    DOMAIN,
 )
 
+if TYPE_CHECKING:
+    from .coordinator import YarboConfigEntry
+
 
 async def async_get_config_entry_diagnostics(
-    hass: HomeAssistant, entry: ConfigEntry
+    hass: HomeAssistant, entry: YarboConfigEntry
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry.
 
@@ -32,9 +31,8 @@ async def async_get_config_entry_diagnostics(
 
     TODO: Implement in v0.1.0
     """
-    data = hass.data[DOMAIN][entry.entry_id]
-    coordinator = data[DATA_COORDINATOR]
-    client = data[DATA_CLIENT]
+    coordinator = entry.runtime_data.coordinator
+    client = entry.runtime_data.client
 
     raw_source = coordinator.data
     if isinstance(raw_source, dict):
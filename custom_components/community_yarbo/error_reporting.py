@@ -17,6 +17,11 @@ _LOGGER = logging.getLogger(__name__)
 _DEFAULT_DSN = "https://c9d816d9a8714ac288e86b49c683b533@glitchtip.lassfolk.cc/4"
 
 
+def _is_opted_out(enabled: bool) -> bool:
+    """Return True when reporting is switched off or YARBO_SENTRY_DSN is set to ""."""
+    return not enabled or os.environ.get("YARBO_SENTRY_DSN") == ""
+
+
 def init_error_reporting(
     dsn: str | None = None,
     environment: str = "production",
@@ -37,14 +42,11 @@ def init_error_reporting(
         enabled: Master switch. If False, no SDK initialization occurs.
         tags: Optional extra tags (e.g. robot_serial, ha_version, integration_version).
     """
-    if not enabled:
+    if _is_opted_out(enabled):
         return
 
     # Resolve DSN: explicit arg > YARBO_SENTRY_DSN env var > built-in default
     env_dsn = os.environ.get("YARBO_SENTRY_DSN")
-    if env_dsn is not None and env_dsn == "":
-        return  # Explicitly disabled
-
     effective_dsn = dsn or env_dsn or _DEFAULT_DSN
 
     if not effective_dsn:
@@ -168,4 +170,6 @@ async def async_init_error_reporting(
     tags: dict[str, str] | None = None,
 ) -> None:
     """Initialize error reporting in the executor to avoid blocking the event loop."""
+    if _is_opted_out(enabled):
+        return  # Skip the executor round-trip
     await hass.async_add_executor_job(init_error_reporting, dsn, environment, enabled, tags)
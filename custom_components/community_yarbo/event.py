@@ -12,7 +12,7 @@ from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.util import dt as dt_util
 
-from .const import CONF_ROBOT_SERIAL, DATA_COORDINATOR, DOMAIN, get_activity_state
+from .const import CONF_ROBOT_SERIAL, DOMAIN, get_activity_state
 from .coordinator import YarboDataCoordinator
 from .entity import YarboEntity
 from .models import YarboTelemetry
@@ -35,7 +35,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Yarbo event entities."""
-    coordinator = hass.data[DOMAIN][entry.entry_id][DATA_COORDINATOR]
+    coordinator = entry.runtime_data.coordinator
     async_add_entities([YarboEventEntity(coordinator)])
 
 
@@ -11,8 +11,6 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from yarbo import YarboLightState
 
 from .const import (
-    DATA_COORDINATOR,
-    DOMAIN,
     HEAD_TYPE_NONE,
     LIGHT_CHANNEL_BODY_LEFT,
     LIGHT_CHANNEL_BODY_RIGHT,
@@ -45,7 +43,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Yarbo light entities."""
-    coordinator = hass.data[DOMAIN][entry.entry_id][DATA_COORDINATOR]
+    coordinator = entry.runtime_data.coordinator
     entities: list[LightEntity] = [
         YarboAllLightsGroup(coordinator),
         YarboHeadLight(coordinator),
@@ -12,13 +12,13 @@ import logging
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.repairs import RepairsFlow
-from homeassistant.config_entries import SOURCE_REAUTH
+from homeassistant.config_entries import SOURCE_REAUTH, ConfigEntryState
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import issue_registry as ir
 
-from .const import CONF_ROBOT_NAME, DATA_COORDINATOR, DOMAIN
+from .const import CONF_ROBOT_NAME, DOMAIN
 from .controller import async_ensure_controller
 
 _LOGGER = logging.getLogger(__name__)
@@ -142,10 +142,9 @@ class YarboRepairFlow(RepairsFlow):
             # Controller lost → re-acquire controller
             if issue_id.startswith(f"{ISSUE_CONTROLLER_LOST}_"):
                 entry_id = issue_id[len(f"{ISSUE_CONTROLLER_LOST}_") :]
-                if DOMAIN in self.hass.data and entry_id in self.hass.data[DOMAIN]:
-                    coordinator: YarboDataCoordinator = self.hass.data[DOMAIN][entry_id][
-                        DATA_COORDINATOR
-                    ]
+                entry = self.hass.config_entries.async_get_entry(entry_id)
+                if entry is not None and entry.state is ConfigEntryState.LOADED:
+                    coordinator: YarboDataCoordinator = entry.runtime_data.coordinator
                     async with coordinator.command_lock:
                         try:
                             await async_ensure_controller(coordinator.client, timeout=5.0)
@@ -27,9 +27,7 @@ from .const import (
     CONF_BROKER_HOST,
     CONF_CONNECTION_PATH,
     CONF_ROVER_IP,
-    DATA_COORDINATOR,
     DEFAULT_ACTIVITY_PERSONALITY,
-    DOMAIN,
     HEAD_TYPE_LAWN_MOWER,
     HEAD_TYPE_LAWN_MOWER_PRO,
     HEAD_TYPE_LEAF_BLOWER,
@@ -109,7 +107,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Yarbo sensors based on a config entry."""
-    coordinator = hass.data[DOMAIN][entry.entry_id][DATA_COORDINATOR]
+    coordinator = entry.runtime_data.coordinator
     async_add_entities(
         [
             YarboConnectionSensor(coordinator),
@@ -6,14 +6,13 @@ import logging
 from typing import Any
 
 import voluptuous as vol
+from homeassistant.config_entries import ConfigEntryState
 from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import device_registry as dr
 from yarbo import YarboLightState
 
 from .const import (
-    DATA_CLIENT,
-    DATA_COORDINATOR,
     DEFAULT_AUTO_CONTROLLER,
     DOMAIN,
     OPT_AUTO_CONTROLLER,
@@ -122,10 +121,10 @@ def _get_client_and_coordinator(hass: HomeAssistant, device_id: str) -> tuple[An
     if not device.config_entries:
         raise ServiceValidationError(f"Device {device_id} has no config entry")
     entry_id = next(iter(device.config_entries))
-    if entry_id not in hass.data.get(DOMAIN, {}):
+    entry = hass.config_entries.async_get_entry(entry_id)
+    if entry is None or entry.domain != DOMAIN or entry.state is not ConfigEntryState.LOADED:
         raise ServiceValidationError(f"Device {device_id} is not managed by the Yarbo integration")
-    data = hass.data[DOMAIN][entry_id]
-    return data[DATA_CLIENT], data[DATA_COORDINATOR]
+    return entry.runtime_data.client, entry.runtime_data.coordinator
 
 
 async def _acquire_controller(client: Any, coordinator: Any) -> None:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any
 
@@ -29,9 +30,8 @@ def get_raw_dict(telemetry: Any) -> dict[str, Any]:
     return raw if isinstance(raw, dict) else {}
 
 
-def get_nested_raw_value(telemetry: Any, *path: str) -> Any | None:
-    """Return nested raw value by path from telemetry."""
-    raw: Any = get_raw_dict(telemetry)
+def _walk_raw(raw: Any, path: tuple[str, ...]) -> Any | None:
+    """Return the value at ``path`` inside an already-resolved raw dict."""
     for key in path:
         if not isinstance(raw, dict) or key not in raw:
             return None
@@ -39,10 +39,19 @@ def get_nested_raw_value(telemetry: Any, *path: str) -> Any | None:
     return raw
 
 
-def get_value_from_paths(telemetry: Any, paths: list[tuple[str, ...]]) -> Any | None:
-    """Return the first non-None value from a list of raw paths."""
+def get_nested_raw_value(telemetry: Any, *path: str) -> Any | None:
+    """Return nested raw value by path from telemetry."""
+    return _walk_raw(get_raw_dict(telemetry), path)
+
+
+def get_value_from_paths(telemetry: Any, paths: Sequence[tuple[str, ...]]) -> Any | None:
+    """Return the first non-None value from a list of raw paths.
+
+    The raw dict is resolved once and shared by all paths.
+    """
+    raw = get_raw_dict(telemetry)
     for path in paths:
-        value = get_nested_raw_value(telemetry, *path)
+        value = _walk_raw(raw, path)
         if value is not None:
             return value
     return None
@@ -25,9 +25,7 @@ from .const import (
     CONF_CLOUD_REFRESH_TOKEN,
     CONF_CLOUD_USERNAME,
     CONF_ROBOT_NAME,
-    DATA_COORDINATOR,
     DEFAULT_CLOUD_ENABLED,
-    DOMAIN,
     OPT_CLOUD_ENABLED,
 )
 from .coordinator import YarboDataCoordinator
@@ -46,7 +44,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Yarbo firmware update entity."""
-    coordinator: YarboDataCoordinator = hass.data[DOMAIN][entry.entry_id][DATA_COORDINATOR]
+    coordinator: YarboDataCoordinator = entry.runtime_data.coordinator
     async_add_entities([YarboFirmwareUpdate(coordinator)])
 
 
@@ -18,6 +18,8 @@ if "aiodns" not in sys.modules:
     class DNSResolver:
         """Stub for aiodns.DNSResolver."""
 
+        __slots__ = ()
+
         def __init__(self, *_args: object, **_kwargs: object) -> None:
             pass
 
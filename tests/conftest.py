@@ -33,6 +33,8 @@ _aiodns_module = types.ModuleType("aiodns")
 class _DNSResolver:
     """Stub for aiodns.DNSResolver."""
 
+    __slots__ = ()
+
     def __init__(self, *_args: object, **_kwargs: object) -> None:
         pass
 
@@ -3,11 +3,15 @@
 from __future__ import annotations
 
 import time
+from datetime import UTC, datetime
 from unittest.mock import MagicMock
 
 from homeassistant.helpers.entity import EntityCategory
 
 from custom_components.community_yarbo.binary_sensor import (
+    FLAG_BINARY_SENSORS,
+    YarboChargingSensor,
+    YarboFlagBinarySensor,
     YarboNoChargePeriodSensor,
     YarboOnlineBinarySensor,
 )
@@ -106,3 +110,103 @@ class TestYarboOnlineBinarySensor:
         coord = self._make_online_coordinator(last_seen=None)
         entity = YarboOnlineBinarySensor(coord)
         assert entity.is_on is False
+
+    def test_reevaluated_on_interval_check(self) -> None:
+        """The interval check recomputes the state and writes only when it flips."""
+        coord = self._make_online_coordinator(last_seen=None)
+        entity = YarboOnlineBinarySensor(coord)
+        entity.async_write_ha_state = MagicMock()
+        assert entity.is_on is False
+
+        entity._async_check_online(datetime.now(UTC))
+        entity.async_write_ha_state.assert_not_called()
+
+        coord.last_seen = time.monotonic()
+        entity._async_check_online(datetime.now(UTC))
+        assert entity.is_on is True
+        entity.async_write_ha_state.assert_called_once()
+
+    def test_not_recomputed_on_coordinator_update(self) -> None:
+        """Telemetry updates do not re-evaluate the heartbeat age."""
+        coord = self._make_online_coordinator(last_seen=None)
+        entity = YarboOnlineBinarySensor(coord)
+        entity.async_write_ha_state = MagicMock()
+
+        coord.last_seen = time.monotonic()
+        entity._handle_coordinator_update()
+        assert entity.is_on is False
+
+
+class TestYarboChargingSensor:
+    """Tests for the charging binary sensor and per-frame state memo."""
+
+    def test_is_on_follows_new_frames(self) -> None:
+        """A new telemetry object is re-evaluated; the same object is served from the memo."""
+        coord = _make_coordinator()
+        coord.data = MagicMock(charging_status=2)
+        entity = YarboChargingSensor(coord)
+        assert entity.is_on is True
+
+        coord.data.charging_status = 0
+        assert entity.is_on is True  # same frame, memoised
+
+        coord.data = MagicMock(charging_status=0)
+        assert entity.is_on is False
+
+    def test_is_on_none_without_telemetry(self) -> None:
+        """No telemetry yet means unknown state."""
+        coord = _make_coordinator()
+        entity = YarboChargingSensor(coord)
+        assert entity.is_on is None
+
+    def test_unchanged_state_is_not_rewritten(self) -> None:
+        """Coordinator ticks that leave is_on unchanged skip async_write_ha_state."""
+        coord = _make_coordinator()
+        coord.data = MagicMock(charging_status=2)
+        entity = YarboChargingSensor(coord)
+        entity.async_write_ha_state = MagicMock()
+
+        entity._handle_coordinator_update()
+        entity._handle_coordinator_update()
+        assert entity.async_write_ha_state.call_count == 1
+
+        coord.data = MagicMock(charging_status=0)
+        entity._handle_coordinator_update()
+        assert entity.async_write_ha_state.call_count == 2
+
+
+class TestYarboFlagBinarySensor:
+    """Tests for the description-driven telemetry flag sensors."""
+
+    def _make_sensor(self, coord: MagicMock, key: str) -> YarboFlagBinarySensor:
+        description = next(d for d in FLAG_BINARY_SENSORS if d.key == key)
+        return YarboFlagBinarySensor(coord, description)
+
+    def test_description_attributes(self) -> None:
+        """Translation key, device class and default enablement come from the description."""
+        entity = self._make_sensor(_make_coordinator(), "rain_detected")
+        assert entity.translation_key == "rain_detected"
+        assert entity.unique_id == "TEST0010_rain_detected"
+        assert entity.device_class == "moisture"
+        assert entity.entity_registry_enabled_default is False
+
+    def test_attribute_takes_priority(self) -> None:
+        """A telemetry attribute wins over the raw fallback."""
+        coord = _make_coordinator()
+        coord.data = MagicMock(on_going_planning=0, raw={"StateMSG": {"on_going_planning": 1}})
+        assert self._make_sensor(coord, "planning_active").is_on is False
+
+    def test_raw_fallback_paths(self) -> None:
+        """Missing attributes fall back to the raw paths in priority order."""
+        coord = _make_coordinator()
+        coord.data = MagicMock(
+            robot_follow_state=None,
+            raw={"RunningStatusMSG": {"robot_follow_state": 1}, "robot_follow_state": 0},
+        )
+        assert self._make_sensor(coord, "follow_mode").is_on is True
+
+    def test_unknown_when_flag_missing(self) -> None:
+        """No attribute and no raw value means unknown state."""
+        coord = _make_coordinator()
+        coord.data = MagicMock(planning_paused=None, raw={})
+        assert self._make_sensor(coord, "planning_paused").is_on is None
@@ -6,18 +6,10 @@ import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import EntityCategory
 
-from custom_components.community_yarbo.button import (
-    YarboEmergencyUnlockButton,
-    YarboManualStopButton,
-    YarboPlaySoundButton,
-    YarboRestartButton,
-    YarboSaveChargingPointButton,
-    YarboSaveMapBackupButton,
-    YarboShutdownButton,
-    YarboStartHotspotButton,
-)
+from custom_components.community_yarbo.button import BUTTONS, YarboButton
 from custom_components.community_yarbo.const import CONF_ROBOT_NAME, CONF_ROBOT_SERIAL
 
 
@@ -38,26 +30,63 @@ def _make_coordinator() -> MagicMock:
     return coord
 
 
+def _make_button(coord: MagicMock, key: str) -> YarboButton:
+    """Build the button entity for the description with the given key."""
+    description = next(d for d in BUTTONS if d.key == key)
+    return YarboButton(coord, description)
+
+
+class TestYarboButtonOffline:
+    """Presses fail fast while the MQTT client is disconnected."""
+
+    @pytest.mark.asyncio
+    async def test_press_raises_without_acquiring_controller(self) -> None:
+        coord = _make_coordinator()
+        coord.client.is_connected = False
+        entity = _make_button(coord, "return_to_dock")
+        with pytest.raises(HomeAssistantError, match="not connected"):
+            await entity.async_press()
+        coord.client.get_controller.assert_not_called()
+        coord.client.publish_raw.assert_not_called()
+
+
+class TestYarboBeepButton:
+    """Tests for the beep button, which uses a library call instead of publish_raw."""
+
+    @pytest.mark.asyncio
+    async def test_press_calls_buzzer(self) -> None:
+        """Press acquires the controller and calls client.buzzer(state=1)."""
+        coord = _make_coordinator()
+        coord.client.buzzer = AsyncMock()
+        entity = _make_button(coord, "beep")
+
+        await entity.async_press()
+
+        coord.client.get_controller.assert_called_once_with(timeout=5.0)
+        coord.client.buzzer.assert_called_once_with(state=1)
+        coord.client.publish_raw.assert_not_called()
+
+
 class TestYarboEmergencyUnlockButton:
     """Tests for emergency unlock button."""
 
     def test_translation_key(self) -> None:
         """Translation key must be emergency_unlock."""
         coord = _make_coordinator()
-        entity = YarboEmergencyUnlockButton(coord)
+        entity = _make_button(coord, "emergency_unlock")
         assert entity.translation_key == "emergency_unlock"
 
     def test_icon(self) -> None:
         """Icon must be mdi:lock-open-alert."""
         coord = _make_coordinator()
-        entity = YarboEmergencyUnlockButton(coord)
+        entity = _make_button(coord, "emergency_unlock")
         assert entity.icon == "mdi:lock-open-alert"
 
     @pytest.mark.asyncio
     async def test_press_publishes_command(self) -> None:
         """Press sends emergency_unlock command."""
         coord = _make_coordinator()
-        entity = YarboEmergencyUnlockButton(coord)
+        entity = _make_button(coord, "emergency_unlock")
 
         with patch.object(entity, "async_write_ha_state"):
             await entity.async_press()
@@ -72,20 +101,20 @@ class TestYarboPlaySoundButton:
     def test_translation_key(self) -> None:
         """Translation key must be play_sound."""
         coord = _make_coordinator()
-        entity = YarboPlaySoundButton(coord)
+        entity = _make_button(coord, "play_sound")
         assert entity.translation_key == "play_sound"
 
     def test_icon(self) -> None:
         """Icon must be mdi:music-note."""
         coord = _make_coordinator()
-        entity = YarboPlaySoundButton(coord)
+        entity = _make_button(coord, "play_sound")
         assert entity.icon == "mdi:music-note"
 
     @pytest.mark.asyncio
     async def test_press_publishes_command(self) -> None:
         """Press sends song_cmd command."""
         coord = _make_coordinator()
-        entity = YarboPlaySoundButton(coord)
+        entity = _make_button(coord, "play_sound")
 
         with patch.object(entity, "async_write_ha_state"):
             await entity.async_press()
@@ -103,26 +132,26 @@ class TestYarboShutdownButton:
     def test_translation_key(self) -> None:
         """Translation key must be shutdown."""
         coord = _make_coordinator()
-        entity = YarboShutdownButton(coord)
+        entity = _make_button(coord, "shutdown")
         assert entity.translation_key == "shutdown"
 
     def test_icon(self) -> None:
         """Icon must be mdi:power."""
         coord = _make_coordinator()
-        entity = YarboShutdownButton(coord)
+        entity = _make_button(coord, "shutdown")
         assert entity.icon == "mdi:power"
 
     def test_entity_category(self) -> None:
         """Shutdown button is a config entity."""
         coord = _make_coordinator()
-        entity = YarboShutdownButton(coord)
+        entity = _make_button(coord, "shutdown")
         assert entity.entity_category == EntityCategory.CONFIG
 
     @pytest.mark.asyncio
     async def test_press_publishes_command(self) -> None:
         """Press sends shutdown command."""
         coord = _make_coordinator()
-        entity = YarboShutdownButton(coord)
+        entity = _make_button(coord, "shutdown")
 
         with patch.object(entity, "async_write_ha_state"):
             await entity.async_press()
@@ -137,26 +166,26 @@ class TestYarboRestartButton:
     def test_translation_key(self) -> None:
         """Translation key must be restart."""
         coord = _make_coordinator()
-        entity = YarboRestartButton(coord)
+        entity = _make_button(coord, "restart")
         assert entity.translation_key == "restart"
 
     def test_icon(self) -> None:
         """Icon must be mdi:restart."""
         coord = _make_coordinator()
-        entity = YarboRestartButton(coord)
+        entity = _make_button(coord, "restart")
         assert entity.icon == "mdi:restart"
 
     def test_entity_category(self) -> None:
         """Restart button is a config entity."""
         coord = _make_coordinator()
-        entity = YarboRestartButton(coord)
+        entity = _make_button(coord, "restart")
         assert entity.entity_category == EntityCategory.CONFIG
 
     @pytest.mark.asyncio
     async def test_press_publishes_command(self) -> None:
         """Press sends restart_container command."""
         coord = _make_coordinator()
-        entity = YarboRestartButton(coord)
+        entity = _make_button(coord, "restart")
 
         with patch.object(entity, "async_write_ha_state"):
             await entity.async_press()
@@ -171,20 +200,20 @@ class TestYarboManualStopButton:
     def test_translation_key(self) -> None:
         """Translation key must be manual_stop."""
         coord = _make_coordinator()
-        entity = YarboManualStopButton(coord)
+        entity = _make_button(coord, "manual_stop")
         assert entity.translation_key == "manual_stop"
 
     def test_icon(self) -> None:
         """Icon must be mdi:stop."""
         coord = _make_coordinator()
-        entity = YarboManualStopButton(coord)
+        entity = _make_button(coord, "manual_stop")
         assert entity.icon == "mdi:stop"
 
     @pytest.mark.asyncio
     async def test_press_publishes_command(self) -> None:
         """Press sends cmd_vel with zeros."""
         coord = _make_coordinator()
-        entity = YarboManualStopButton(coord)
+        entity = _make_button(coord, "manual_stop")
 
         with patch.object(entity, "async_write_ha_state"):
             await entity.async_press()
@@ -199,20 +228,20 @@ class TestYarboSaveChargingPointButton:
     def test_disabled_by_default(self) -> None:
         """Save charging point button must be disabled by default."""
         coord = _make_coordinator()
-        entity = YarboSaveChargingPointButton(coord)
+        entity = _make_button(coord, "save_charging_point")
         assert entity.entity_registry_enabled_default is False
 
     def test_entity_category(self) -> None:
         """Save charging point is a config entity."""
         coord = _make_coordinator()
-        entity = YarboSaveChargingPointButton(coord)
+        entity = _make_button(coord, "save_charging_point")
         assert entity.entity_category == EntityCategory.CONFIG
 
     @pytest.mark.asyncio
     async def test_press_publishes_command(self) -> None:
         """Press sends save_charging_point command."""
         coord = _make_coordinator()
-        entity = YarboSaveChargingPointButton(coord)
+        entity = _make_button(coord, "save_charging_point")
 
         with patch.object(entity, "async_write_ha_state"):
             await entity.async_press()
@@ -227,20 +256,20 @@ class TestYarboStartHotspotButton:
     def test_disabled_by_default(self) -> None:
         """Start hotspot button must be disabled by default."""
         coord = _make_coordinator()
-        entity = YarboStartHotspotButton(coord)
+        entity = _make_button(coord, "start_hotspot")
         assert entity.entity_registry_enabled_default is False
 
     def test_entity_category(self) -> None:
         """Start hotspot is a config entity."""
         coord = _make_coordinator()
-        entity = YarboStartHotspotButton(coord)
+        entity = _make_button(coord, "start_hotspot")
         assert entity.entity_category == EntityCategory.CONFIG
 
     @pytest.mark.asyncio
     async def test_press_publishes_command(self) -> None:
         """Press sends start_hotspot command."""
         coord = _make_coordinator()
-        entity = YarboStartHotspotButton(coord)
+        entity = _make_button(coord, "start_hotspot")
 
         with patch.object(entity, "async_write_ha_state"):
             await entity.async_press()
@@ -255,20 +284,20 @@ class TestYarboSaveMapBackupButton:
     def test_disabled_by_default(self) -> None:
         """Save map backup button must be disabled by default."""
         coord = _make_coordinator()
-        entity = YarboSaveMapBackupButton(coord)
+        entity = _make_button(coord, "save_map_backup")
         assert entity.entity_registry_enabled_default is False
 
     def test_entity_category(self) -> None:
         """Save map backup is a config entity."""
         coord = _make_coordinator()
-        entity = YarboSaveMapBackupButton(coord)
+        entity = _make_button(coord, "save_map_backup")
         assert entity.entity_category == EntityCategory.CONFIG
 
     @pytest.mark.asyncio
     async def test_press_publishes_command(self) -> None:
         """Press sends save_map_backup command."""
         coord = _make_coordinator()
-        entity = YarboSaveMapBackupButton(coord)
+        entity = _make_button(coord, "save_map_backup")
 
         with patch.object(entity, "async_write_ha_state"):
             await entity.async_press()
@@ -278,31 +307,21 @@ class TestYarboSaveMapBackupButton:
         coord.client.publish_raw.assert_called_once_with("save_map_backup", {})
 
 
-# ---- imports for new entities ----
-from custom_components.community_yarbo.button import (  # noqa: E402
-    YarboCameraCalibrationButton,
-    YarboCheckCameraStatusButton,
-    YarboFirmwareUpdateLaterButton,
-    YarboFirmwareUpdateNowButton,
-    YarboFirmwareUpdateTonightButton,
-)
-
-
 class TestYarboCameraCalibrationButton:
     """Tests for camera calibration button."""
 
     def test_disabled_by_default(self) -> None:
         coord = _make_coordinator()
-        assert YarboCameraCalibrationButton(coord).entity_registry_enabled_default is False
+        assert _make_button(coord, "camera_calibration").entity_registry_enabled_default is False
 
     def test_entity_category(self) -> None:
         coord = _make_coordinator()
-        assert YarboCameraCalibrationButton(coord).entity_category == EntityCategory.CONFIG
+        assert _make_button(coord, "camera_calibration").entity_category == EntityCategory.CONFIG
 
     @pytest.mark.asyncio
     async def test_press_publishes_command(self) -> None:
         coord = _make_coordinator()
-        entity = YarboCameraCalibrationButton(coord)
+        entity = _make_button(coord, "camera_calibration")
         with patch.object(entity, "async_write_ha_state"):
             await entity.async_press()
         coord.client.get_controller.assert_called_once_with(timeout=5.0)
@@ -315,12 +334,12 @@ class TestYarboCheckCameraStatusButton:
 
     def test_disabled_by_default(self) -> None:
         coord = _make_coordinator()
-        assert YarboCheckCameraStatusButton(coord).entity_registry_enabled_default is False
+        assert _make_button(coord, "check_camera_status").entity_registry_enabled_default is False
 
     @pytest.mark.asyncio
     async def test_press_publishes_command(self) -> None:
         coord = _make_coordinator()
-        entity = YarboCheckCameraStatusButton(coord)
+        entity = _make_button(coord, "check_camera_status")
         with patch.object(entity, "async_write_ha_state"):
             await entity.async_press()
         coord.client.get_controller.assert_called_once_with(timeout=5.0)
@@ -333,16 +352,16 @@ class TestYarboFirmwareUpdateNowButton:
 
     def test_disabled_by_default(self) -> None:
         coord = _make_coordinator()
-        assert YarboFirmwareUpdateNowButton(coord).entity_registry_enabled_default is False
+        assert _make_button(coord, "firmware_update_now").entity_registry_enabled_default is False
 
     def test_entity_category(self) -> None:
         coord = _make_coordinator()
-        assert YarboFirmwareUpdateNowButton(coord).entity_category == EntityCategory.CONFIG
+        assert _make_button(coord, "firmware_update_now").entity_category == EntityCategory.CONFIG
 
     @pytest.mark.asyncio
     async def test_press_publishes_command(self) -> None:
         coord = _make_coordinator()
-        entity = YarboFirmwareUpdateNowButton(coord)
+        entity = _make_button(coord, "firmware_update_now")
         with patch.object(entity, "async_write_ha_state"):
             await entity.async_press()
         coord.client.get_controller.assert_called_once_with(timeout=5.0)
@@ -355,12 +374,14 @@ class TestYarboFirmwareUpdateTonightButton:
 
     def test_disabled_by_default(self) -> None:
         coord = _make_coordinator()
-        assert YarboFirmwareUpdateTonightButton(coord).entity_registry_enabled_default is False
+        assert (
+            _make_button(coord, "firmware_update_tonight").entity_registry_enabled_default is False
+        )
 
     @pytest.mark.asyncio
     async def test_press_publishes_command(self) -> None:
         coord = _make_coordinator()
-        entity = YarboFirmwareUpdateTonightButton(coord)
+        entity = _make_button(coord, "firmware_update_tonight")
         with patch.object(entity, "async_write_ha_state"):
             await entity.async_press()
         coord.client.get_controller.assert_called_once_with(timeout=5.0)
@@ -373,12 +394,12 @@ class TestYarboFirmwareUpdateLaterButton:
 
     def test_disabled_by_default(self) -> None:
         coord = _make_coordinator()
-        assert YarboFirmwareUpdateLaterButton(coord).entity_registry_enabled_default is False
+        assert _make_button(coord, "firmware_update_later").entity_registry_enabled_default is False
 
     @pytest.mark.asyncio
     async def test_press_publishes_command(self) -> None:
         coord = _make_coordinator()
-        entity = YarboFirmwareUpdateLaterButton(coord)
+        entity = _make_button(coord, "firmware_update_later")
         with patch.object(entity, "async_write_ha_state"):
             await entity.async_press()
         coord.client.get_controller.assert_called_once_with(timeout=5.0)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import AsyncGenerator
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -24,10 +25,13 @@ from custom_components.community_yarbo.const import (
     DEFAULT_BROKER_PORT,
     DEFAULT_TELEMETRY_THROTTLE,
     DOMAIN,
+    ENDPOINT_TYPE_DC,
+    ENDPOINT_TYPE_ROVER,
     OPT_ACTIVITY_PERSONALITY,
     OPT_AUTO_CONTROLLER,
     OPT_TELEMETRY_THROTTLE,
 )
+from custom_components.community_yarbo.discovery import YarboEndpoint
 from tests.conftest import (
     MOCK_BROKER_HOST,
     MOCK_BROKER_MAC,
@@ -48,6 +52,18 @@ async def _async_gen_one(item: Any) -> AsyncGenerator[Any, None]:
     yield item
 
 
+async def _async_gen_empty() -> AsyncGenerator[Any, None]:
+    """Async generator that ends without yielding a frame."""
+    return
+    yield
+
+
+async def _async_gen_slow() -> AsyncGenerator[Any, None]:
+    """Async generator whose first frame arrives only after the test timeout."""
+    await asyncio.sleep(1)
+    yield _mock_telemetry()
+
+
 class TestManualConfigFlow:
     """Tests for the manual (user) config flow step.
 
@@ -170,7 +186,7 @@ class TestManualConfigFlow:
         mock_client = MagicMock()
         mock_client.connect = AsyncMock()
         mock_client.disconnect = AsyncMock()
-        mock_client.watch_telemetry = MagicMock(return_value=_async_gen_one(_mock_telemetry()))
+        mock_client.watch_telemetry = MagicMock(side_effect=_async_gen_slow)
         mock_client.get_controller = AsyncMock()
         mock_client.is_connected = True
         with (
@@ -183,8 +199,8 @@ class TestManualConfigFlow:
                 return_value=mock_client,
             ),
             patch(
-                "custom_components.community_yarbo.config_flow.asyncio.wait_for",
-                side_effect=TimeoutError(),
+                "custom_components.community_yarbo.config_flow.MQTT_TEST_TELEMETRY_TIMEOUT",
+                0.05,
             ),
         ):
             result = await hass.config_entries.flow.async_init(
@@ -199,6 +215,36 @@ class TestManualConfigFlow:
         assert result["errors"]["base"] == "no_telemetry"
         assert result["step_id"] == "mqtt_test"
 
+    async def test_user_step_telemetry_stream_ends(
+        self, hass: HomeAssistant, enable_custom_integrations: None
+    ) -> None:
+        """A telemetry stream that ends before its first frame shows no_telemetry."""
+        mock_client = MagicMock()
+        mock_client.connect = AsyncMock()
+        mock_client.disconnect = AsyncMock()
+        mock_client.watch_telemetry = MagicMock(side_effect=_async_gen_empty)
+        mock_client.is_connected = True
+        with (
+            patch(
+                "custom_components.community_yarbo.config_flow.async_discover_endpoints",
+                return_value=[],
+            ),
+            patch(
+                "custom_components.community_yarbo.config_flow.YarboLocalClient",
+                return_value=mock_client,
+            ),
+        ):
+            result = await hass.config_entries.flow.async_init(
+                DOMAIN, context={"source": config_entries.SOURCE_USER}
+            )
+            result = await hass.config_entries.flow.async_configure(
+                result["flow_id"],
+                {CONF_BROKER_HOST: MOCK_BROKER_HOST, CONF_BROKER_PORT: DEFAULT_BROKER_PORT},
+            )
+        assert result["type"] == FlowResultType.FORM
+        assert result["errors"]["base"] == "no_telemetry"
+        assert result["step_id"] == "mqtt_test"
+
     async def test_user_step_decode_error(
         self, hass: HomeAssistant, enable_custom_integrations: None
     ) -> None:
@@ -282,6 +328,35 @@ class TestManualConfigFlow:
         assert result2["reason"] == "already_configured"
 
 
+class TestAcceptEndpoint:
+    """Tests for applying a chosen discovery endpoint to the flow state."""
+
+    def test_single_endpoint(self) -> None:
+        """A lone rover endpoint is the broker, the rover and the only failover host."""
+        flow = YarboConfigFlow()
+        ep = YarboEndpoint(host="192.0.2.20", port=1883, endpoint_type=ENDPOINT_TYPE_ROVER)
+        flow._discovered_endpoints = [ep]
+        flow._accept_endpoint(ep)
+        assert flow._broker_host == "192.0.2.20"
+        assert flow._connection_path == ENDPOINT_TYPE_ROVER
+        assert flow._rover_ip == "192.0.2.20"
+        assert flow._alternate_host is None
+        assert flow._broker_endpoints_ordered == ["192.0.2.20"]
+
+    def test_chosen_endpoint_keeps_discovery_order(self) -> None:
+        """Choosing the second endpoint keeps the first as alternate and the library order."""
+        flow = YarboConfigFlow()
+        dc = YarboEndpoint(host="192.0.2.10", port=1883, endpoint_type=ENDPOINT_TYPE_DC)
+        rover = YarboEndpoint(host="192.0.2.20", port=1884, endpoint_type=ENDPOINT_TYPE_ROVER)
+        flow._discovered_endpoints = [dc, rover]
+        flow._accept_endpoint(rover)
+        assert flow._broker_host == "192.0.2.20"
+        assert flow._broker_port == 1884
+        assert flow._alternate_host == "192.0.2.10"
+        assert flow._rover_ip == "192.0.2.20"
+        assert flow._broker_endpoints_ordered == ["192.0.2.10", "192.0.2.20"]
+
+
 class TestDhcpDiscoveryFlow:
     """Tests for DHCP auto-discovery config flow.
 
@@ -441,6 +516,88 @@ class TestDhcpDiscoveryFlow:
         assert result["type"] == FlowResultType.ABORT
         assert result["reason"] == "already_configured"
 
+    async def test_dhcp_discovery_matches_mac_in_other_format(
+        self, hass: HomeAssistant, enable_custom_integrations: None
+    ) -> None:
+        """A stored colon MAC matches a bare DHCP MAC, so a new IP goes to reconfigure."""
+        from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+        mock_entry = MockConfigEntry(
+            domain=DOMAIN,
+            data={
+                CONF_ROBOT_SERIAL: MOCK_ROBOT_SERIAL,
+                CONF_BROKER_HOST: "192.0.2.99",
+                CONF_BROKER_PORT: DEFAULT_BROKER_PORT,
+                CONF_BROKER_MAC: MOCK_BROKER_MAC,
+                CONF_ROBOT_NAME: MOCK_ROBOT_NAME,
+            },
+            unique_id=MOCK_ROBOT_SERIAL,
+        )
+        mock_entry.add_to_hass(hass)
+
+        discovery_info = dhcp.DhcpServiceInfo(
+            ip=MOCK_BROKER_HOST,
+            macaddress=MOCK_BROKER_MAC.replace(":", ""),
+            hostname="yarbo-dc",
+        )
+        # Robot asleep: no serial from the probe, so only the MAC identifies it
+        with patch.object(YarboConfigFlow, "_probe_robot_identity", return_value=(None, None)):
+            result = await hass.config_entries.flow.async_init(
+                DOMAIN,
+                context={"source": config_entries.SOURCE_DHCP},
+                data=discovery_info,
+            )
+        assert result["type"] == FlowResultType.FORM
+        assert result["step_id"] == "reconfigure"
+
+
+class TestReconfigureFlow:
+    """Tests for the reconfigure flow."""
+
+    async def test_reconfigure_keeps_port_when_cleared(
+        self, hass: HomeAssistant, enable_custom_integrations: None
+    ) -> None:
+        """Submitting reconfigure without a port keeps the entry's current port."""
+        from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+        mock_entry = MockConfigEntry(
+            domain=DOMAIN,
+            data={
+                CONF_ROBOT_SERIAL: MOCK_ROBOT_SERIAL,
+                CONF_BROKER_HOST: "192.0.2.99",
+                CONF_BROKER_PORT: 8883,
+                CONF_ROBOT_NAME: MOCK_ROBOT_NAME,
+            },
+            unique_id=MOCK_ROBOT_SERIAL,
+        )
+        mock_entry.add_to_hass(hass)
+
+        with (
+            patch(
+                "custom_components.community_yarbo.config_flow._run_mqtt_test_sync",
+                return_value=(_mock_telemetry(), MOCK_ROBOT_SERIAL),
+            ) as mqtt_test,
+            patch(
+                "custom_components.community_yarbo.async_setup_entry",
+                return_value=True,
+            ),
+        ):
+            result = await hass.config_entries.flow.async_init(
+                DOMAIN,
+                context={
+                    "source": config_entries.SOURCE_RECONFIGURE,
+                    "entry_id": mock_entry.entry_id,
+                },
+            )
+            assert result["step_id"] == "reconfigure"
+            result = await hass.config_entries.flow.async_configure(
+                result["flow_id"], {CONF_BROKER_HOST: MOCK_BROKER_HOST}
+            )
+        assert result["type"] == FlowResultType.ABORT
+        assert result["reason"] == "reconfigure_successful"
+        mqtt_test.assert_called_once_with(MOCK_BROKER_HOST, 8883)
+        assert mock_entry.data[CONF_BROKER_PORT] == 8883
+
 
 class TestOptionsFlow:
     """Tests for the Yarbo options flow (issue #26).
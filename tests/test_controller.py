@@ -8,7 +8,10 @@ import pytest
 from homeassistant.exceptions import HomeAssistantError
 from yarbo.exceptions import YarboTimeoutError
 
-from custom_components.community_yarbo.controller import async_ensure_controller
+from custom_components.community_yarbo.controller import (
+    async_ensure_controller,
+    invalidate_controller,
+)
 
 
 @pytest.mark.asyncio
@@ -26,3 +29,52 @@ async def test_async_ensure_controller_success() -> None:
     client = AsyncMock()
     await async_ensure_controller(client, timeout=3.0)
     client.get_controller.assert_awaited_once_with(timeout=3.0)
+
+
+@pytest.mark.asyncio
+async def test_async_ensure_controller_reuses_recent_acquisition() -> None:
+    """A second call shortly after success skips get_controller while the role is held."""
+    client = AsyncMock()
+    client.controller_acquired = True
+    await async_ensure_controller(client, reuse=True)
+    await async_ensure_controller(client, reuse=True)
+    client.get_controller.assert_awaited_once_with(timeout=5.0)
+
+    client.controller_acquired = False
+    await async_ensure_controller(client, reuse=True)
+    assert client.get_controller.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_async_ensure_controller_reacquires_without_reuse() -> None:
+    """Callers that do not opt in always re-run get_controller (e.g. the repair flow)."""
+    client = AsyncMock()
+    client.controller_acquired = True
+    await async_ensure_controller(client, reuse=True)
+    await async_ensure_controller(client)
+    assert client.get_controller.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_acquire_is_not_reused() -> None:
+    """A timed-out get_controller drops an earlier acquisition."""
+    client = AsyncMock()
+    client.controller_acquired = True
+    await async_ensure_controller(client)
+    client.get_controller.side_effect = YarboTimeoutError("ack timeout")
+    with pytest.raises(HomeAssistantError):
+        await async_ensure_controller(client)
+    client.get_controller.side_effect = None
+    await async_ensure_controller(client, reuse=True)
+    assert client.get_controller.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_invalidate_controller_forces_reacquire() -> None:
+    """After invalidation the next call re-runs get_controller even if the role is held."""
+    client = AsyncMock()
+    client.controller_acquired = True
+    await async_ensure_controller(client, reuse=True)
+    invalidate_controller(client)
+    await async_ensure_controller(client, reuse=True)
+    assert client.get_controller.await_count == 2
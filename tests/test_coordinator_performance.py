@@ -12,8 +12,10 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from custom_components.community_yarbo.const import DOMAIN
-from custom_components.community_yarbo.coordinator import YarboDataCoordinator
+from custom_components.community_yarbo.coordinator import (
+    YarboDataCoordinator,
+    YarboRuntimeData,
+)
 from custom_components.community_yarbo.diagnostics import async_get_config_entry_diagnostics
 
 
@@ -57,15 +59,11 @@ async def test_diagnostics_includes_listener_count_and_poll_interval(
 ) -> None:
     """Diagnostics should expose listener_count and poll_interval for performance debugging."""
     hass = MagicMock()
-    hass.data = {
-        DOMAIN: {
-            coordinator_with_mock_listeners._entry.entry_id: {
-                "coordinator": coordinator_with_mock_listeners,
-                "client": coordinator_with_mock_listeners.client,
-            }
-        }
-    }
     entry = coordinator_with_mock_listeners._entry
+    entry.runtime_data = YarboRuntimeData(
+        client=coordinator_with_mock_listeners.client,
+        coordinator=coordinator_with_mock_listeners,
+    )
 
     diag = await async_get_config_entry_diagnostics(hass, entry)
 
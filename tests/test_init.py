@@ -14,7 +14,7 @@ class TestAsyncSetupEntry:
     These tests verify the integration setup contract:
     - YarboClient is instantiated and connected
     - YarboDataCoordinator is created
-    - Data is stored in hass.data
+    - Client and coordinator are stored on entry.runtime_data
     - Platforms are forwarded
     """
 
@@ -29,8 +29,7 @@ class TestAsyncSetupEntry:
         # TODO: Implement when async_setup_entry calls YarboClient
         # result = await async_setup_entry(hass, mock_config_entry)
         # assert result is True
-        # assert DOMAIN in hass.data
-        # assert mock_config_entry.entry_id in hass.data[DOMAIN]
+        # assert mock_config_entry.runtime_data.client is not None
         pass
 
     @pytest.mark.skip(reason="Stub — implement in v0.1.0")
@@ -128,6 +127,41 @@ def test_resolve_broker_host() -> None:
     assert _resolve_broker_host({}) is None
 
 
+def test_coerce_broker_port() -> None:
+    """Blank or missing ports fall back to the default; others are coerced to int."""
+    from custom_components.community_yarbo.const import DEFAULT_BROKER_PORT, coerce_broker_port
+
+    assert coerce_broker_port(None) == DEFAULT_BROKER_PORT
+    assert coerce_broker_port("") == DEFAULT_BROKER_PORT
+    assert coerce_broker_port("8883") == 8883
+    assert coerce_broker_port(1884) == 1884
+
+
+def test_get_activity_state() -> None:
+    """Error code wins over charging, charging over the working state table."""
+    from types import SimpleNamespace
+
+    from custom_components.community_yarbo.const import get_activity_state
+
+    def activity(state: int = 0, charging_status: int = 0, error_code: int = 0) -> str:
+        return get_activity_state(
+            SimpleNamespace(state=state, charging_status=charging_status, error_code=error_code)
+        )
+
+    assert activity(state=1, error_code=3) == "error"
+    assert activity(state=1, charging_status=2) == "charging"
+    assert [activity(state=s) for s in (0, 1, 2, 5, 6, 7, 8, 9)] == [
+        "idle",
+        "working",
+        "returning",
+        "paused",
+        "error",
+        "working",
+        "working",
+        "idle",
+    ]
+
+
 def test_min_lib_version_constant() -> None:
     """Ensure MIN_LIB_VERSION is set and the installed library meets it."""
     import importlib.metadata
@@ -140,3 +174,42 @@ def test_min_lib_version_constant() -> None:
     assert Version(installed) >= Version(MIN_LIB_VERSION), (
         f"Installed python-yarbo {installed} < required {MIN_LIB_VERSION}"
     )
+
+
+async def test_migrate_v1_with_endpoints_only_bumps_version() -> None:
+    """A v1 entry that already has endpoints is migrated without rewriting data."""
+    from unittest.mock import MagicMock
+
+    from custom_components.community_yarbo import async_migrate_entry
+    from custom_components.community_yarbo.const import CONF_BROKER_ENDPOINTS, CONF_BROKER_HOST
+
+    hass = MagicMock()
+    entry = MagicMock()
+    entry.version = 1
+    entry.data = {CONF_BROKER_HOST: "10.0.0.1", CONF_BROKER_ENDPOINTS: ["10.0.0.1"]}
+
+    assert await async_migrate_entry(hass, entry) is True
+    hass.config_entries.async_update_entry.assert_called_once_with(entry, version=2)
+
+
+def test_no_duplicate_class_definitions() -> None:
+    """Each class is defined in exactly one integration module (no copied platform files)."""
+    import ast
+    import pathlib
+
+    package_dir = (
+        pathlib.Path(__file__).resolve().parents[1] / "custom_components" / "community_yarbo"
+    )
+    pyfiles = sorted(package_dir.rglob("*.py"))
+    assert pyfiles, f"no integration modules found under {package_dir}"
+
+    defined: dict[str, str] = {}
+    for pyfile in pyfiles:
+        tree = ast.parse(pyfile.read_text())
+        for node in tree.body:
+            if not isinstance(node, ast.ClassDef):
+                continue
+            assert node.name not in defined, (
+                f"{node.name} defined in both {defined[node.name]} and {pyfile}"
+            )
+            defined[node.name] = str(pyfile)
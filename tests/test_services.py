@@ -262,7 +262,7 @@ class TestGetClientAndCoordinator:
             _get_client_and_coordinator(hass, "nonexistent-device-id")
 
     async def test_device_not_in_domain_data_raises(self, hass: HomeAssistant) -> None:
-        """Raises ServiceValidationError when device found but not in hass.data."""
+        """Raises ServiceValidationError when the device has no loaded Yarbo entry."""
         from unittest.mock import MagicMock
 
         from homeassistant.helpers import device_registry as dr